@@ -0,0 +1,34 @@
+"""add_meeting_owner_start_time_index
+
+Revision ID: 4a7f471606a5
+Revises: e163c0702d03
+Create Date: 2026-10-15 09:12:31.418265
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4a7f471606a5"
+down_revision: Union[str, None] = "e163c0702d03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_index(
+        "ix_meeting_owner_id_start_time_id",
+        "meeting",
+        ["owner_id", sa.text("start_time DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("ix_meeting_owner_id_start_time_id", table_name="meeting")
@@ -0,0 +1,32 @@
+"""add_follow_reverse_pair_index
+
+Revision ID: 5d2e9c7b1f43
+Revises: 73ff8d1a6ce2
+Create Date: 2026-10-15 17:58:22.904116
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2e9c7b1f43"
+down_revision: Union[str, None] = "73ff8d1a6ce2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_index(
+        "ix_follow_following_follower",
+        "follow",
+        ["following_id", "follower_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("ix_follow_following_follower", table_name="follow")
@@ -0,0 +1,43 @@
+"""add_follow_unique_pair_constraint
+
+Revision ID: 73ff8d1a6ce2
+Revises: 9442be02917c
+Create Date: 2026-10-15 16:41:07.213548
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "73ff8d1a6ce2"
+down_revision: Union[str, None] = "9442be02917c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Keep the earliest row of any pair duplicated by the old check-then-insert.
+    op.execute(
+        """
+        DELETE FROM follow a
+        USING follow b
+        WHERE a.follower_id = b.follower_id
+          AND a.following_id = b.following_id
+          AND (a.created_at, a.id) > (b.created_at, b.id)
+        """
+    )
+    op.create_unique_constraint(
+        "uq_follow_follower_id_following_id",
+        "follow",
+        ["follower_id", "following_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_constraint(
+        "uq_follow_follower_id_following_id", "follow", type_="unique"
+    )
@@ -0,0 +1,40 @@
+"""add_user_search_trigram_indexes
+
+Revision ID: 9442be02917c
+Revises: 4a7f471606a5
+Create Date: 2026-10-15 14:03:52.731904
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9442be02917c"
+down_revision: Union[str, None] = "4a7f471606a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ("name", "account", "email")
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f"ix_user_{column}_trgm",
+            "user",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    for column in SEARCH_COLUMNS:
+        op.drop_index(f"ix_user_{column}_trgm", table_name="user")
+    # pg_trgm is left installed; other objects may depend on it.
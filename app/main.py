@@ -4,12 +4,16 @@ Initializes the FastAPI application with routes, middleware, exception handlers,
 and third-party integrations like Sentry and Logfire.
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import logfire
 import sentry_sdk
 import uvicorn
 from fastapi import APIRouter, FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRoute
 from pydantic import ValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
@@ -17,24 +21,38 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.routes import auth, calendar, follow, health, meeting, user
 from app.utils.config import settings
 from app.utils.exceptions import (
+    InvalidRequestError,
     http_validation_error,
+    invalid_request_error,
     request_validation_error,
     validation_error,
 )
+from app.utils.redisdb import redis_client
 
 
 def create_app() -> FastAPI:
     init_sentry()
 
+    # No schema (and therefore no /docs or /redoc) is served in production.
+    openapi_url = (
+        f"{settings.API_V1_STR}/openapi.json"
+        if settings.ENVIRONMENT != "production"
+        else None
+    )
+
     app = FastAPI(
         title=settings.PROJECT_NAME,
-        openapi_url=f"{settings.API_V1_STR}/openapi.json",
+        openapi_url=openapi_url,
+        # orjson encodes datetimes and UUIDs natively, in C.
+        default_response_class=ORJSONResponse,
         generate_unique_id_function=custom_generate_unique_id,
+        lifespan=lifespan,
     )
 
     app.add_exception_handler(StarletteHTTPException, http_validation_error)
     app.add_exception_handler(RequestValidationError, request_validation_error)
     app.add_exception_handler(ValidationError, validation_error)
+    app.add_exception_handler(InvalidRequestError, invalid_request_error)
 
     app.add_middleware(
         CORSMiddleware,
@@ -51,6 +69,13 @@ def create_app() -> FastAPI:
     return app
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await redis_client.connect()
+    yield
+    await redis_client.disconnect()
+
+
 def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.tags[0]}-{route.name}"
 
@@ -10,7 +10,7 @@ Endpoints:
 
 from datetime import timedelta
 
-from fastapi import APIRouter, Form, HTTPException, Response, status
+from fastapi import APIRouter, Form, HTTPException, status
 
 from app.utils import security
 from app.utils.config import settings
@@ -28,11 +28,13 @@ router = APIRouter()
 
 
 @router.post("/login")
-def login_with_email_password(
-    user_service: UserServiceDep, credentials: EmailPasswordLogin, response: Response
+async def login_with_email_password(
+    user_service: UserServiceDep, credentials: EmailPasswordLogin
 ) -> TokenWithRefresh:
     """Authenticate user with email and password"""
-    user = user_service.authenticate(credentials.email, credentials.password)
+    user = await user_service.authenticate(
+        credentials.email, credentials.password
+    )
 
     if not user:
         raise HTTPException(
@@ -46,14 +48,12 @@ def login_with_email_password(
     )
     refresh_token = security.create_refresh_token(user.id)
 
-    response.status_code = status.HTTP_200_OK
     return TokenWithRefresh(access_token=access_token, refresh_token=refresh_token)
 
 
-@router.post("/register")
-def register_user(
+@router.post("/register", status_code=status.HTTP_201_CREATED)
+async def register_user(
     user_service: UserServiceDep,
-    response: Response,
     name: str = Form(...),
     account: str = Form(...),
     email: str = Form(...),
@@ -68,16 +68,11 @@ def register_user(
 
     user_in = UserRegister(name=name, account=account, email=email, password=password)
 
-    try:
-        registered_user = user_service.register_user(user_in)
-        response.status_code = status.HTTP_201_CREATED
-        return registered_user
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return await user_service.register_user(user_in)
 
 
 @router.post("/token")
-def refresh_access_token(request: RefreshTokenRequest, response: Response) -> Token:
+async def refresh_access_token(request: RefreshTokenRequest) -> Token:
     """Get a new access token"""
     user_id = security.verify_refresh_token(request.refresh_token)
 
@@ -91,5 +86,4 @@ def refresh_access_token(request: RefreshTokenRequest, response: Response) -> To
         user_id, expires_delta=access_token_expires
     )
 
-    response.status_code = status.HTTP_200_OK
     return Token(access_token=access_token)
@@ -15,7 +15,7 @@ Endpoints:
 
 import uuid
 from typing import Annotated
-from fastapi import APIRouter, Response, status, Query
+from fastapi import APIRouter, status, Query
 from app.utils.delegate import CurrentUser, CalendarServiceDep
 from app.utils.models import (
     CalendarEntriesResponse,
@@ -34,14 +34,12 @@ router = APIRouter()
 
 
 @router.get("/entries/list", response_model=CalendarEntriesResponse)
-def get_calendar_entries(
+async def get_calendar_entries(
     current_user: CurrentUser,
     calendar_service: CalendarServiceDep,
-    response: Response,
 ) -> CalendarEntriesResponse:
     """Get all calendar entries for the current user."""
-    availability = calendar_service.get_user_availability(current_user.id)
-    response.status_code = status.HTTP_200_OK
+    availability = await calendar_service.get_user_availability(current_user.id)
     
     return CalendarEntriesResponse(
         entries=[
@@ -58,14 +56,12 @@ def get_calendar_entries(
 
 
 @router.get("/grouped", response_model=CalendarGroupedResponse)
-def get_calendar_grouped(
+async def get_calendar_grouped(
     current_user: CurrentUser,
     calendar_service: CalendarServiceDep,
-    response: Response,
 ) -> CalendarGroupedResponse:
     """Get calendar entries grouped by day of week."""
-    grouped_data = calendar_service.get_grouped_availability(current_user.id)
-    response.status_code = status.HTTP_200_OK
+    grouped_data = await calendar_service.get_grouped_availability(current_user.id)
     
     # Convert to TimeInterval objects
     grouped_intervals = {}
@@ -78,12 +74,11 @@ def get_calendar_grouped(
     return CalendarGroupedResponse(grouped_by_day=grouped_intervals)
 
 
-@router.post("/intervals")
-def create_calendar_intervals(
+@router.post("/intervals", status_code=status.HTTP_201_CREATED)
+async def create_calendar_intervals(
     current_user: CurrentUser,
     calendar_service: CalendarServiceDep,
     interval_data: CalendarIntervalCreate,
-    response: Response,
 ) -> dict[str, str]:
     """Create availability intervals for a specific day."""
     # Convert TimeInterval objects to dicts
@@ -92,28 +87,25 @@ def create_calendar_intervals(
         for interval in interval_data.intervals
     ]
     
-    calendar_service.create_intervals_for_day(
+    await calendar_service.create_intervals_for_day(
         current_user.id,
         interval_data.day_of_week,
         intervals_dict,
     )
     
     # Update onboarding status to mark calendar as completed
-    calendar_service.update_onboarding(current_user.id, calendar=True)
+    await calendar_service.update_onboarding(current_user.id, calendar=True)
     
-    response.status_code = status.HTTP_201_CREATED
     return {"message": "Calendar intervals created successfully"}
 
 
 @router.get("/exceptions", response_model=AvailabilityExceptionsResponse)
-def get_availability_exceptions(
+async def get_availability_exceptions(
     current_user: CurrentUser,
     calendar_service: CalendarServiceDep,
-    response: Response,
 ) -> AvailabilityExceptionsResponse:
     """Get availability exceptions for the current user."""
-    exceptions = calendar_service.get_user_exceptions(current_user.id)
-    response.status_code = status.HTTP_200_OK
+    exceptions = await calendar_service.get_user_exceptions(current_user.id)
     
     return AvailabilityExceptionsResponse(
         exceptions=[
@@ -130,15 +122,14 @@ def get_availability_exceptions(
     )
 
 
-@router.post("/exceptions")
-def create_availability_exception(
+@router.post("/exceptions", status_code=status.HTTP_201_CREATED)
+async def create_availability_exception(
     current_user: CurrentUser,
     calendar_service: CalendarServiceDep,
     exception_data: AvailabilityExceptionCreate,
-    response: Response,
 ) -> dict[str, str]:
     """Create availability exception with recurrence support."""
-    calendar_service.create_exception(
+    await calendar_service.create_exception(
         current_user.id,
         str(exception_data.exception_date),
         exception_data.recurrence_type,
@@ -147,56 +138,49 @@ def create_availability_exception(
         exception_data.end_time,
         exception_data.is_available,
     )
-    response.status_code = status.HTTP_201_CREATED
     return {"message": "Availability exception created successfully"}
 
 
 # Google Calendar Integration Endpoints
 @router.get("/google/auth-url", response_model=GoogleCalendarAuthUrl)
-def get_google_calendar_auth_url(
+async def get_google_calendar_auth_url(
     client_id: Annotated[str, Query()],
     redirect_uri: Annotated[str, Query()],
     calendar_service: CalendarServiceDep,
-    response: Response,
 ) -> GoogleCalendarAuthUrl:
     """Get Google Calendar OAuth authorization URL."""
     auth_url = calendar_service.generate_google_auth_url(client_id, redirect_uri)
-    response.status_code = status.HTTP_200_OK
     
     return GoogleCalendarAuthUrl(auth_url=auth_url)
 
 
 @router.post("/google/connect")
-def connect_google_calendar(
+async def connect_google_calendar(
     current_user: CurrentUser,
     calendar_service: CalendarServiceDep,
     code: Annotated[str, Query()],
     state: Annotated[str, Query()],
     client_id: Annotated[str, Query()],
     redirect_uri: Annotated[str, Query()],
-    response: Response,
 ) -> dict[str, str]:
     """Handle Google Calendar OAuth callback and connect account."""
-    calendar_service.handle_google_oauth_callback(
+    await calendar_service.handle_google_oauth_callback(
         current_user.id, code, client_id, redirect_uri
     )
-    response.status_code = status.HTTP_200_OK
     return {"message": "Google Calendar connected successfully"}
 
 
 @router.get("/google/freebusy", response_model=FreeBusyResponse)
-def get_google_calendar_freebusy(
+async def get_google_calendar_freebusy(
     current_user: CurrentUser,
     calendar_service: CalendarServiceDep,
     start_datetime: Annotated[str, Query()],
     end_datetime: Annotated[str, Query()],
-    response: Response,
 ) -> FreeBusyResponse:
     """Get Google Calendar freebusy data for a date range."""
     freebusy_data = calendar_service.get_freebusy_data(
         current_user.id, start_datetime, end_datetime
     )
-    response.status_code = status.HTTP_200_OK
     
     return FreeBusyResponse(
         busy_times=[
@@ -212,25 +196,22 @@ def get_google_calendar_freebusy(
 
 # Onboarding Endpoint
 @router.get("/onboarding/check", response_model=OnboardingPublic)
-def get_onboarding_status(
+async def get_onboarding_status(
     current_user: CurrentUser,
     calendar_service: CalendarServiceDep,
-    response: Response,
 ) -> OnboardingPublic:
     """Get user's calendar onboarding status."""
-    onboarding = calendar_service.get_user_onboarding(current_user.id)
-    response.status_code = status.HTTP_200_OK
+    onboarding = await calendar_service.get_user_onboarding(current_user.id)
     
     if onboarding:
         # Check if user has completed calendar setup by having availability entries
-        availability = calendar_service.get_user_availability(current_user.id)
-        has_calendar_entries = len(availability) > 0
+        has_calendar_entries = await calendar_service.has_availability(current_user.id)
         
         # Update onboarding status and completion based on calendar entries
         if has_calendar_entries and not onboarding.calendar:
-            onboarding = calendar_service.update_onboarding(current_user.id, calendar=True, completed=True)
+            onboarding = await calendar_service.update_onboarding(current_user.id, calendar=True, completed=True)
         elif has_calendar_entries and onboarding.calendar and not onboarding.completed:
-            onboarding = calendar_service.update_onboarding(current_user.id, completed=True)
+            onboarding = await calendar_service.update_onboarding(current_user.id, completed=True)
         
         return OnboardingPublic(
             id=onboarding.id,
@@ -239,7 +220,7 @@ def get_onboarding_status(
         )
     else:
         # Create new onboarding record
-        new_onboarding = calendar_service.update_onboarding(current_user.id)
+        new_onboarding = await calendar_service.update_onboarding(current_user.id)
         return OnboardingPublic(
             id=new_onboarding.id,
             calendar=new_onboarding.calendar,
@@ -12,10 +12,12 @@ Endpoints:
 """
 
 import uuid
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Response, status
+from fastapi import APIRouter, HTTPException, Query, status
+from sqlalchemy import Row
 
-from app.utils.delegate import CurrentUser, FollowServiceDep
+from app.utils.delegate import CurrentUser, FollowServiceDep, RedisDep
 from app.utils.models import (
     FollowerListPublic,
     FollowerRelation,
@@ -24,36 +26,56 @@ from app.utils.models import (
     FollowingRelation,
     FollowStatus,
     Message,
+    User,
     UserPublic,
 )
+from app.utils.params import PaginationParams
+from app.utils.redisdb import cache_key
 
 router = APIRouter()
 
+
+def _follow_cache_keys(user_id: uuid.UUID, target_user_id: uuid.UUID) -> list[str]:
+    """Cache entries affected when user_id follows or unfollows target_user_id."""
+    return [
+        cache_key("follow:status", user_id, target_user_id),
+        cache_key("follow:status", target_user_id, user_id),
+        cache_key("follow:counts", user_id),
+        cache_key("follow:counts", target_user_id),
+    ]
+
+
+def _public_user(user: User | Row) -> UserPublic:
+    """Build UserPublic from a trusted DB row without re-running validators."""
+    return UserPublic.model_construct(
+        **{field: getattr(user, field) for field in UserPublic.model_fields}
+    )
+
+
 @router.post("/{user_id}/start", response_model=Message)
-def follow_user(
+async def follow_user(
     user_id: uuid.UUID,
     follow_service: FollowServiceDep,
     current_user: CurrentUser,
-    response: Response,
+    redis: RedisDep,
 ) -> Message:
     """Follow a user"""
-    try:
-        follow_service.follow_user(current_user.id, user_id)
-        response.status_code = status.HTTP_200_OK
-        return Message(message="FOLLOW_SUCCESSFUL")
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    await follow_service.follow_user(current_user.id, user_id)
+
+    await redis.delete_many(*_follow_cache_keys(current_user.id, user_id))
+
+    return Message(message="FOLLOW_SUCCESSFUL")
 
 
 @router.post("/{user_id}/stop", response_model=Message)
-def unfollow_user(
+async def unfollow_user(
     user_id: uuid.UUID,
     follow_service: FollowServiceDep,
     current_user: CurrentUser,
-    response: Response,
+    redis: RedisDep,
 ) -> Message:
     """Unfollow a user"""
-    success = follow_service.unfollow_user(current_user.id, user_id)
+    success = await follow_service.unfollow_user(current_user.id, user_id)
 
     if not success:
         raise HTTPException(
@@ -61,82 +83,107 @@ def unfollow_user(
             detail="Follow relationship not found",
         )
 
-    response.status_code = status.HTTP_200_OK
+    await redis.delete_many(*_follow_cache_keys(current_user.id, user_id))
+
     return Message(message="UNFOLLOW_SUCCESSFUL")
 
 
-@router.get("/me/following/list", response_model=FollowingListPublic)
-def get_my_following(
+@router.get(
+    "/me/following/list",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": FollowingListPublic}},
+)
+async def get_my_following(
     follow_service: FollowServiceDep,
     current_user: CurrentUser,
-    skip: int = 0,
-    limit: int = 20,
-    response: Response = None,
-):
+    params: Annotated[PaginationParams, Query()],
+) -> FollowingListPublic:
     """Get current user's following list"""
-    results = follow_service.get_following_list(current_user.id, skip, limit)
+    results = await follow_service.get_following_list(
+        current_user.id, params.skip, params.limit
+    )
 
     formatted = [
-        FollowingRelation(
-            id=follow.id,
-            following_id=follow.following_id,
-            user=UserPublic.model_validate(user),
-            created_at=follow.created_at,
-            updated_at=follow.updated_at,
+        FollowingRelation.model_construct(
+            id=row.follow_id,
+            following_id=row.following_id,
+            user=_public_user(row),
+            created_at=row.follow_created_at,
+            updated_at=row.follow_updated_at,
         )
-        for follow, user in results
+        for row in results
     ]
 
-    response.status_code = status.HTTP_200_OK
-    return FollowingListPublic(data=formatted, count=len(formatted))
+    return FollowingListPublic.model_construct(data=formatted, count=len(formatted))
 
 
-@router.get("/me/followers/list", response_model=FollowerListPublic)
-def get_my_followers(
+@router.get(
+    "/me/followers/list",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": FollowerListPublic}},
+)
+async def get_my_followers(
     follow_service: FollowServiceDep,
     current_user: CurrentUser,
-    skip: int = 0,
-    limit: int = 20,
-    response: Response = None,
+    params: Annotated[PaginationParams, Query()],
 ) -> FollowerListPublic:
     """Get current user's followers list"""
-    results = follow_service.get_followers_list(current_user.id, skip, limit)
+    results = await follow_service.get_followers_list(
+        current_user.id, params.skip, params.limit
+    )
 
     formatted = [
-        FollowerRelation(
-            id=follow.id,
-            follower_id=follow.follower_id,
-            user=UserPublic.model_validate(user),
-            created_at=follow.created_at,
-            updated_at=follow.updated_at,
+        FollowerRelation.model_construct(
+            id=row.follow_id,
+            follower_id=row.follower_id,
+            user=_public_user(row),
+            created_at=row.follow_created_at,
+            updated_at=row.follow_updated_at,
         )
-        for follow, user in results
+        for row in results
     ]
 
-    response.status_code = status.HTTP_200_OK
-    return FollowerListPublic(data=formatted, count=len(formatted))
+    return FollowerListPublic.model_construct(data=formatted, count=len(formatted))
 
 
 @router.get("/status/{user_id}", response_model=FollowStatus)
-def get_follow_status(
+async def get_follow_status(
     user_id: uuid.UUID,
     follow_service: FollowServiceDep,
     current_user: CurrentUser,
-    response: Response,
+    redis: RedisDep,
 ) -> FollowStatus:
     """Get follow status of a user"""
-    response.status_code = status.HTTP_200_OK
-    return follow_service.get_follow_status(current_user.id, user_id)
+    key = cache_key("follow:status", current_user.id, user_id)
+    cached = await redis.get(key)
+
+    if cached is not None:
+        follow_status = FollowStatus.model_validate(cached)
+    else:
+        follow_status = await follow_service.get_follow_status(
+            current_user.id, user_id
+        )
+        await redis.set(key, follow_status.model_dump())
+
+    return follow_status
 
 
 @router.get("/{user_id}/stats/view", response_model=FollowCountStatus)
-def get_follow_counts(
+async def get_follow_counts(
     user_id: uuid.UUID,
     follow_service: FollowServiceDep,
-    response: Response,
+    redis: RedisDep,
 ) -> FollowCountStatus:
     """Get follower and following counts for a specific user"""
-    response.status_code = status.HTTP_200_OK
-    return follow_service.get_follow_counts(user_id)
+    key = cache_key("follow:counts", user_id)
+    cached = await redis.get(key)
+
+    if cached is not None:
+        counts = FollowCountStatus.model_validate(cached)
+    else:
+        counts = await follow_service.get_follow_counts(user_id)
+        await redis.set(key, counts.model_dump())
+
+    return counts
 
 
@@ -10,7 +10,7 @@ Endpoints:
 from fastapi import APIRouter, Response, status
 from sqlmodel import text
 
-from app.utils.delegate import SessionDep
+from app.utils.delegate import AsyncSessionDep
 
 router = APIRouter()
 
@@ -22,7 +22,7 @@ def health_check() -> Response:
 
 
 @router.get("/readiness", status_code=status.HTTP_204_NO_CONTENT)
-def readiness_check(session: SessionDep) -> Response:
+async def readiness_check(session: AsyncSessionDep) -> Response:
     """Ensure the service is ready to handle requests"""
-    session.exec(text("SELECT 1"))
+    await session.exec(text("SELECT 1"))
     return Response(status_code=status.HTTP_204_NO_CONTENT)
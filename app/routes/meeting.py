@@ -9,25 +9,40 @@ Endpoints:
 - GET /requests: Retrieve meeting invitations awaiting response.
 - GET /{meeting_id}: Fetch details of a specific meeting.
 - POST /{meeting_id}/participants/add: Add participant to a meeting.
-- POST /{meeting_id}/approve: Accept a meeting invitation.
-- POST /{meeting_id}/decline: Decline a meeting invitation.
+- POST /{meeting_id}/participants/bulk: Add several participants at once.
+- POST /{meeting_id}/status/{action}: Accept or decline a meeting invitation.
+- POST /{meeting_id}/approve, /{meeting_id}/decline: Deprecated aliases of the above.
 - POST /{meeting_id}/update: Update meeting details.
 - POST /{meeting_id}/delete: Delete a meeting.
 - POST /participants/{participant_id}/delete: Remove a participant from a meeting.
 """
 
+import hashlib
 import uuid
-
-from fastapi import APIRouter, HTTPException, Query, Response, status
+from typing import Annotated, Literal
+
+from fastapi import (
+    APIRouter,
+    Body,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from pydantic import BaseModel
 
 from app.utils.delegate import (
     CurrentUser,
     MeetingServiceDep,
+    RedisDep,
+    rate_limit,
 )
 from app.utils.models import (
     MeetingCreate,
     MeetingObject,
     MeetingPublic,
+    MeetingsPublic,
     MeetingTypeBase,
     MeetingTypePublic,
     Message,
@@ -35,234 +50,290 @@ from app.utils.models import (
     ParticipantPublic,
     ParticipantStatus,
 )
+from app.utils.params import CursorParams, MeetingListParams
+from app.utils.redisdb import cache_key
 
 router = APIRouter()
 
+# Meeting details change on every participant write, so keep entries short-lived.
+MEETING_CACHE_TTL = 30
+
+
+def _list_response(page: BaseModel, total_count: int | None) -> Response:
+    """Serialize a service-built page once, skipping response_model re-validation."""
+    headers = {"X-Total-Count": str(total_count)} if total_count is not None else None
+    return Response(
+        content=page.model_dump_json(),
+        media_type="application/json",
+        headers=headers,
+    )
 
-@router.post("/create", response_model=MeetingPublic)
-def create_meeting_with_participants(
+
+@router.post(
+    "/create",
+    response_model=MeetingPublic,
+    dependencies=[rate_limit("meeting:create", 10)],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_meeting_with_participants(
     meeting_with_participants: MeetingCreate,
     current_user: CurrentUser,
     meeting_service: MeetingServiceDep,
-    response: Response,
 ) -> MeetingPublic:
     """Create a new meeting with participants"""
-    try:
-        result = meeting_service.create_meeting_with_participants(
-            meeting_with_participants, owner_id=current_user.id
-        )
-        response.status_code = status.HTTP_201_CREATED
-        return result
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return await meeting_service.create_meeting_with_participants(
+        meeting_with_participants, owner_id=current_user.id
+    )
 
 
-@router.get("/index", response_model=list[MeetingPublic])
-def get_my_meetings(
+@router.get(
+    "/index",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": MeetingsPublic}},
+)
+async def get_my_meetings(
     meeting_service: MeetingServiceDep,
     current_user: CurrentUser,
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
-    include_as_participant: bool = Query(
-        True, description="Include meetings where user is a participant"
-    ),
-    response: Response = None,
-) -> list[MeetingPublic]:
+    params: Annotated[MeetingListParams, Query()],
+) -> Response:
     """Get all meetings"""
-    try:
-        meetings, _ = meeting_service.get_user_meetings(
-            user_id=current_user.id,
-            skip=skip,
-            limit=limit,
-            include_as_participant=include_as_participant,
-        )
-        response.status_code = status.HTTP_200_OK
-        return meetings
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve meetings",
-        )
+    meetings, total_count = await meeting_service.get_user_meetings(
+        user_id=current_user.id,
+        cursor=params.cursor,
+        limit=params.limit,
+        include_as_participant=params.include_as_participant,
+        include_count=params.include_count,
+    )
+    return _list_response(meetings, total_count)
 
 
-@router.get("/history", response_model=list[MeetingPublic])
-def get_my_meeting_history(
+@router.get(
+    "/history",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": MeetingsPublic}},
+)
+async def get_my_meeting_history(
     meeting_service: MeetingServiceDep,
     current_user: CurrentUser,
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
-    include_as_participant: bool = Query(
-        True, description="Include meetings where user is a participant"
-    ),
-    response: Response = None,
-) -> list[MeetingPublic]:
+    params: Annotated[MeetingListParams, Query()],
+) -> Response:
     """Get past meetings"""
-    try:
-        meetings, _ = meeting_service.get_past_meetings(
-            user_id=current_user.id,
-            skip=skip,
-            limit=limit,
-            include_as_participant=include_as_participant,
-        )
-        response.status_code = status.HTTP_200_OK
-        return meetings
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve meeting history",
-        )
+    meetings, total_count = await meeting_service.get_past_meetings(
+        user_id=current_user.id,
+        cursor=params.cursor,
+        limit=params.limit,
+        include_as_participant=params.include_as_participant,
+        include_count=params.include_count,
+    )
+    return _list_response(meetings, total_count)
 
 
-@router.get("/requests", response_model=list[MeetingPublic])
-def get_my_meeting_requests(
+@router.get(
+    "/requests",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": MeetingsPublic}},
+)
+async def get_my_meeting_requests(
     meeting_service: MeetingServiceDep,
     current_user: CurrentUser,
-    skip: int = 0,
-    limit: int = 100,
-    response: Response = None,
-) -> list[MeetingPublic]:
+    params: Annotated[CursorParams, Query()],
+) -> Response:
     """Get pending meeting invitations"""
-    response.status_code = status.HTTP_200_OK
-    return meeting_service.get_user_meeting_requests(
-        user_id=current_user.id, skip=skip, limit=limit
+    requests, total_count = await meeting_service.get_user_meeting_requests(
+        user_id=current_user.id,
+        cursor=params.cursor,
+        limit=params.limit,
+        include_count=params.include_count,
     )
 
+    return _list_response(requests, total_count)
+
+
+def _meeting_etag(meeting: MeetingPublic) -> str:
+    """Weak ETag over the serialized meeting.
+
+    Participant changes do not touch meeting.updated_at, so the body is hashed.
+    """
+    digest = hashlib.blake2b(meeting.model_dump_json().encode(), digest_size=16)
+    return f'W/"{digest.hexdigest()}"'
+
 
 @router.get("/{meeting_id}", response_model=MeetingPublic)
-def get_meeting(
+async def get_meeting(
     meeting_id: uuid.UUID,
     meeting_service: MeetingServiceDep,
     current_user: CurrentUser,
+    redis: RedisDep,
+    request: Request,
     response: Response,
-) -> MeetingPublic:
+) -> MeetingPublic | Response:
     """Show meeting details"""
-    try:
-        meeting = meeting_service.get_meeting(meeting_id, current_user.id)
-        if not meeting:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Meeting not found or access denied",
-            )
-        response.status_code = status.HTTP_200_OK
-        return meeting
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-
-
-@router.post("/{meeting_id}/participants/add", response_model=ParticipantPublic)
-def add_participant(
+    key = cache_key("meeting", meeting_id)
+    cached = await redis.get(key)
+    if cached is not None:
+        meeting = MeetingPublic.model_validate(cached)
+    else:
+        meeting = await meeting_service.get_meeting(meeting_id, current_user.id)
+        await redis.set(key, meeting.model_dump(), ttl=MEETING_CACHE_TTL)
+
+    etag = _meeting_etag(meeting)
+    # no-cache: clients may keep the body but must revalidate on every use.
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return meeting
+
+
+@router.post(
+    "/{meeting_id}/participants/add",
+    response_model=ParticipantPublic,
+    dependencies=[rate_limit("meeting:participants:add", 30)],
+)
+async def add_participant(
     meeting_id: uuid.UUID,
     participant_in: ParticipantObject,
     meeting_service: MeetingServiceDep,
     current_user: CurrentUser,
-    response: Response,
+    redis: RedisDep,
 ) -> ParticipantPublic:
     """Add participant to meeting"""
-    try:
-        result = meeting_service.add_participant(
-            meeting_id, participant_in, current_user.id
-        )
-        response.status_code = status.HTTP_200_OK
-        return result
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    result = await meeting_service.add_participant(
+        meeting_id, participant_in, current_user.id
+    )
+    await redis.delete(cache_key("meeting", meeting_id))
+    return result
 
 
-@router.post("/{meeting_id}/approve", response_model=Message)
-def approve_meeting(
+@router.post(
+    "/{meeting_id}/participants/bulk",
+    response_model=list[ParticipantPublic],
+    dependencies=[rate_limit("meeting:participants:add", 30)],
+)
+async def add_participants(
     meeting_id: uuid.UUID,
+    participants_in: Annotated[
+        list[ParticipantObject], Body(min_length=1, max_length=200)
+    ],
     meeting_service: MeetingServiceDep,
     current_user: CurrentUser,
-    response: Response,
+    redis: RedisDep,
+) -> list[ParticipantPublic]:
+    """Add several participants to a meeting."""
+    result = await meeting_service.add_participants(
+        meeting_id, participants_in, current_user.id
+    )
+    await redis.delete(cache_key("meeting", meeting_id))
+    return result
+
+
+# Invitation responses: the action in the path picks the participant status.
+PARTICIPANT_ACTIONS = {
+    "accept": (ParticipantStatus.ACCEPTED, "Meeting approved successfully"),
+    "decline": (ParticipantStatus.DECLINED, "Meeting declined successfully"),
+}
+
+
+async def _respond(
+    meeting_id: uuid.UUID,
+    action: Literal["accept", "decline"],
+    meeting_service: MeetingServiceDep,
+    current_user: CurrentUser,
+    redis: RedisDep,
 ) -> Message:
-    """Approve meeting invitation"""
-    try:
-        meeting_service.update_participant_status(
-            meeting_id, current_user.id, ParticipantStatus.ACCEPTED, current_user.id
-        )
-        response.status_code = status.HTTP_200_OK
-        return Message(message="Meeting approved successfully")
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    participant_status, message = PARTICIPANT_ACTIONS[action]
+    await meeting_service.update_participant_status(
+        meeting_id, current_user.id, participant_status, current_user.id
+    )
+    await redis.delete(cache_key("meeting", meeting_id))
+    return Message(message=message)
 
 
-@router.post("/{meeting_id}/decline", response_model=Message)
-def decline_meeting(
+@router.post("/{meeting_id}/status/{action}", response_model=Message)
+async def respond_to_meeting(
     meeting_id: uuid.UUID,
+    action: Literal["accept", "decline"],
     meeting_service: MeetingServiceDep,
     current_user: CurrentUser,
-    response: Response,
+    redis: RedisDep,
 ) -> Message:
-    """Decline meeting invitation"""
-    try:
-        meeting_service.update_participant_status(
-            meeting_id, current_user.id, ParticipantStatus.DECLINED, current_user.id
-        )
-        response.status_code = status.HTTP_200_OK
-        return Message(message="Meeting declined successfully")
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    """Accept or decline a meeting invitation."""
+    return await _respond(meeting_id, action, meeting_service, current_user, redis)
+
+
+@router.post("/{meeting_id}/approve", response_model=Message, deprecated=True)
+async def approve_meeting(
+    meeting_id: uuid.UUID,
+    meeting_service: MeetingServiceDep,
+    current_user: CurrentUser,
+    redis: RedisDep,
+) -> Message:
+    """Deprecated: use POST /{meeting_id}/status/accept."""
+    return await _respond(meeting_id, "accept", meeting_service, current_user, redis)
+
+
+@router.post("/{meeting_id}/decline", response_model=Message, deprecated=True)
+async def decline_meeting(
+    meeting_id: uuid.UUID,
+    meeting_service: MeetingServiceDep,
+    current_user: CurrentUser,
+    redis: RedisDep,
+) -> Message:
+    """Deprecated: use POST /{meeting_id}/status/decline."""
+    return await _respond(meeting_id, "decline", meeting_service, current_user, redis)
 
 
 @router.post("/{meeting_id}/update", response_model=MeetingPublic)
-def update_meeting(
+async def update_meeting(
     meeting_id: uuid.UUID,
     meeting_in: MeetingObject,
     meeting_service: MeetingServiceDep,
     current_user: CurrentUser,
-    response: Response,
+    redis: RedisDep,
 ) -> MeetingPublic:
     """Update meeting"""
-    try:
-        updated = meeting_service.update_meeting(
-            meeting_id, meeting_in, current_user.id
-        )
-        response.status_code = status.HTTP_200_OK
-        return updated
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    updated = await meeting_service.update_meeting(
+        meeting_id, meeting_in, current_user.id
+    )
+    await redis.delete(cache_key("meeting", meeting_id))
+    return updated
 
 
 @router.post("/{meeting_id}/delete", response_model=Message)
-def delete_meeting(
+async def delete_meeting(
     meeting_id: uuid.UUID,
     meeting_service: MeetingServiceDep,
     current_user: CurrentUser,
-    response: Response,
+    redis: RedisDep,
 ) -> Message:
     """Delete meeting"""
-    try:
-        success = meeting_service.delete_meeting(meeting_id, current_user.id)
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found"
-            )
-        response.status_code = status.HTTP_200_OK
-        return Message(message="Meeting deleted successfully")
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    success = await meeting_service.delete_meeting(meeting_id, current_user.id)
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Meeting not found"
+        )
+    await redis.delete(cache_key("meeting", meeting_id))
+    return Message(message="Meeting deleted successfully")
 
 
 @router.post("/participants/{participant_id}/delete", response_model=Message)
-def delete_participant_by_id(
+async def delete_participant_by_id(
     participant_id: uuid.UUID,
     meeting_service: MeetingServiceDep,
     current_user: CurrentUser,
-    response: Response,
+    redis: RedisDep,
 ) -> Message:
     """Delete participant"""
-    try:
-        success = meeting_service.delete_participant_by_id(
-            participant_id, current_user.id
+    meeting_id = await meeting_service.delete_participant_by_id(
+        participant_id, current_user.id
+    )
+    if not meeting_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Participant not found"
         )
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Participant not found"
-            )
-        response.status_code = status.HTTP_200_OK
-        return Message(message="Participant deleted successfully")
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    await redis.delete(cache_key("meeting", meeting_id))
+    return Message(message="Participant deleted successfully")
 
 
 # ============================================================
@@ -271,27 +342,24 @@ def delete_participant_by_id(
 
 
 @router.get("/types", response_model=list[MeetingTypePublic])
-def list_meeting_types(
+async def list_meeting_types(
     meeting_service: MeetingServiceDep,
 ) -> list[MeetingTypePublic]:
     """List all available meeting types."""
-    return meeting_service.list_meeting_types()
+    return await meeting_service.list_meeting_types()
 
 
 @router.get("/types/{type_id}", response_model=MeetingTypePublic)
-def get_meeting_type(
+async def get_meeting_type(
     type_id: uuid.UUID,
     meeting_service: MeetingServiceDep,
 ) -> MeetingTypePublic:
     """Get a specific meeting type by ID."""
-    try:
-        return meeting_service.get_meeting_type_by_id(type_id)
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return await meeting_service.get_meeting_type_by_id(type_id)
 
 
 @router.post("/types", response_model=MeetingTypePublic)
-def create_meeting_type(
+async def create_meeting_type(
     meeting_type_data: MeetingTypeBase,
     current_user: CurrentUser,
     meeting_service: MeetingServiceDep,
@@ -304,17 +372,11 @@ def create_meeting_type(
     #         detail="Only admins can create meeting types"
     #     )
 
-    try:
-        return meeting_service.create_meeting_type(meeting_type_data)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to create meeting type: {str(e)}",
-        )
+    return await meeting_service.create_meeting_type(meeting_type_data)
 
 
 @router.put("/types/{type_id}", response_model=MeetingTypePublic)
-def update_meeting_type(
+async def update_meeting_type(
     type_id: uuid.UUID,
     meeting_type_data: MeetingTypeBase,
     current_user: CurrentUser,
@@ -322,32 +384,21 @@ def update_meeting_type(
 ) -> MeetingTypePublic:
     """Update a meeting type (admin only)."""
     # TODO: Add admin role check
-    try:
-        return meeting_service.update_meeting_type(type_id, meeting_type_data)
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to update meeting type: {str(e)}",
-        )
+    return await meeting_service.update_meeting_type(type_id, meeting_type_data)
 
 
 @router.delete("/types/{type_id}", response_model=Message)
-def delete_meeting_type(
+async def delete_meeting_type(
     type_id: uuid.UUID,
     current_user: CurrentUser,
     meeting_service: MeetingServiceDep,
 ) -> Message:
     """Delete a meeting type (admin only)."""
     # TODO: Add admin role check
-    try:
-        success = meeting_service.delete_meeting_type(type_id)
-        if success:
-            return Message(message="Meeting type deleted successfully")
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Meeting type not found"
-            )
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    success = await meeting_service.delete_meeting_type(type_id)
+    if success:
+        return Message(message="Meeting type deleted successfully")
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Meeting type not found"
+        )
@@ -11,91 +11,104 @@ Endpoints:
 - POST /update: Update current user profile information.
 """
 
-from fastapi import APIRouter, HTTPException, Query, Response, status
+import hashlib
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
 from app.utils.delegate import CurrentUser, UserServiceDep
 from app.utils.models import Message, UserPublic, UsersPublic, UserUpdate
+from app.utils.params import UserSearchParams
 
 router = APIRouter()
 
 
 @router.get("/me/verify")
-def get_user_me(current_user: CurrentUser, response: Response) -> UserPublic:
+async def get_user_me(current_user: CurrentUser) -> UserPublic:
     """Get current user info"""
-    response.status_code = status.HTTP_200_OK
     return current_user
 
 
-@router.get("/find")
-def search_users(
+@router.get(
+    "/find",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": UsersPublic}},
+)
+async def search_users(
     user_service: UserServiceDep,
     _: CurrentUser,
-    q: str = Query(..., min_length=2),
-    skip: int = 0,
-    limit: int = 20,
-    response: Response = None,
-) -> UsersPublic:
+    params: Annotated[UserSearchParams, Query()],
+) -> Response:
     """Search users"""
-    response.status_code = status.HTTP_200_OK
-    return user_service.search_users(q, skip, limit)
+    # UsersPublic was validated in the service; serialize it once, in Rust.
+    users = await user_service.search_users(params.q, params.cursor, params.limit)
+    return Response(content=users.model_dump_json(), media_type="application/json")
 
 
-@router.get("/{account}/lookup")
-def get_user_by_account(
-    account: str, user_service: UserServiceDep, _: CurrentUser, response: Response
-) -> UserPublic:
+def _user_etag(user: UserPublic) -> str:
+    """Weak ETag over the serialized profile.
+
+    Profile writes do not bump user.updated_at, so the body is hashed.
+    """
+    digest = hashlib.blake2b(user.model_dump_json().encode(), digest_size=16)
+    return f'W/"{digest.hexdigest()}"'
+
+
+@router.get("/{account}/lookup", response_model=UserPublic)
+async def get_user_by_account(
+    account: str,
+    user_service: UserServiceDep,
+    _: CurrentUser,
+    request: Request,
+    response: Response,
+) -> UserPublic | Response:
     """Get user by account"""
-    user = user_service.get_user_by_account(account)
+    user = await user_service.get_user_by_account(account)
 
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
-    response.status_code = status.HTTP_200_OK
-    return user
+    user_public = UserPublic.model_validate(user)
+    etag = _user_etag(user_public)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
+    response.headers.update(headers)
+    return user_public
 
-@router.post("/delete")
-def soft_delete_user(
-    user_service: UserServiceDep, current_user: CurrentUser, response: Response
+
+@router.post("/delete", status_code=status.HTTP_202_ACCEPTED)
+async def soft_delete_user(
+    user_service: UserServiceDep, current_user: CurrentUser
 ) -> Message:
     """Soft delete current user"""
-    try:
-        user_service.soft_delete_user(current_user.id)
-        response.status_code = status.HTTP_202_ACCEPTED
-        return Message(message="SCHEDULED_FOR_DELETION")
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    await user_service.soft_delete_user(current_user.id)
+    return Message(message="SCHEDULED_FOR_DELETION")
 
 
 @router.post("/recover")
-def recover_user_account(
-    user_service: UserServiceDep, current_user: CurrentUser, response: Response
+async def recover_user_account(
+    user_service: UserServiceDep, current_user: CurrentUser
 ) -> Message:
     """Recover user account"""
-    success = user_service.recover_user(current_user.id)
+    success = await user_service.recover_user(current_user.id)
 
     if not success:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot recover account."
         )
 
-    response.status_code = status.HTTP_200_OK
     return Message(message="Account successfully recovered!")
 
 
 @router.post("/update")
-def update_user_profile(
+async def update_user_profile(
     user_service: UserServiceDep,
     user_in: UserUpdate,
     current_user: CurrentUser,
-    response: Response,
 ) -> UserPublic:
     """Update current user profile"""
-    try:
-        updated_user = user_service.update_user(current_user.id, user_in)
-        response.status_code = status.HTTP_200_OK
-        return updated_user
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return await user_service.update_user(current_user.id, user_in)
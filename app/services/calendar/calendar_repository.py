@@ -5,9 +5,13 @@ OAuth tokens, event synchronization, and calendar management.
 """
 
 import uuid
+from datetime import UTC, datetime
 from typing import Optional
 
-from sqlmodel import Session, select
+from sqlalchemy import Row
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
+from sqlmodel import delete, exists, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.utils.models import (
     GoogleCalendarAuth,
@@ -19,63 +23,70 @@ from app.utils.models import (
 
 
 class CalendarRepository:
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    def get_user_calendar_auth(self, user_id: uuid.UUID) -> Optional[GoogleCalendarAuth]:
+    async def get_user_calendar_auth(self, user_id: uuid.UUID) -> Optional[GoogleCalendarAuth]:
         """Get Google Calendar authentication for a user."""
         statement = select(GoogleCalendarAuth).where(GoogleCalendarAuth.user_id == user_id)
-        return self.session.exec(statement).first()
+        return (await self.session.exec(statement)).first()
 
-    def create_calendar_auth(
+    async def user_has_auth(self, user_id: uuid.UUID) -> bool:
+        """Check whether a user has calendar authentication, without loading tokens."""
+        statement = select(exists().where(GoogleCalendarAuth.user_id == user_id))
+        return (await self.session.exec(statement)).one()
+
+    async def save_calendar_auth(
         self,
         user_id: uuid.UUID,
         access_token: str,
         refresh_token: str,
         expires_at: int,
     ) -> GoogleCalendarAuth:
-        """Create new calendar authentication record."""
-        auth = GoogleCalendarAuth(
-            user_id=user_id,
-            access_token=access_token,
-            refresh_token=refresh_token,
-            expires_at=expires_at,
-        )
-        self.session.add(auth)
-        self.session.commit()
-        self.session.refresh(auth)
-        return auth
+        """Create or refresh a user's calendar authentication in one upsert.
 
-    def update_calendar_auth(
-        self,
-        auth: GoogleCalendarAuth,
-        access_token: str,
-        expires_at: int,
-    ) -> GoogleCalendarAuth:
-        """Update existing calendar authentication."""
-        auth.access_token = access_token
-        auth.expires_at = expires_at
-        self.session.add(auth)
-        self.session.commit()
-        self.session.refresh(auth)
+        An existing row keeps its refresh token; only the access token and
+        expiry are replaced, as on a token refresh.
+        """
+        statement = (
+            insert(GoogleCalendarAuth)
+            .values(
+                id=uuid.uuid4(),
+                user_id=user_id,
+                access_token=access_token,
+                refresh_token=refresh_token,
+                expires_at=expires_at,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC),
+            )
+            .on_conflict_do_update(
+                index_elements=[GoogleCalendarAuth.user_id],
+                set_={
+                    "access_token": access_token,
+                    "expires_at": expires_at,
+                    "updated_at": datetime.now(UTC),
+                },
+            )
+            .returning(GoogleCalendarAuth)
+            .execution_options(populate_existing=True)
+        )
+        auth = (await self.session.scalars(statement)).one()
+        await self.session.flush()
         return auth
 
-    def delete_calendar_auth(self, user_id: uuid.UUID) -> bool:
+    async def delete_calendar_auth(self, user_id: uuid.UUID) -> bool:
         """Delete calendar authentication for a user."""
-        statement = select(GoogleCalendarAuth).where(GoogleCalendarAuth.user_id == user_id)
-        auth = self.session.exec(statement).first()
-        if auth:
-            self.session.delete(auth)
-            self.session.commit()
-            return True
-        return False
-
-    def get_calendar_events(self, user_id: uuid.UUID) -> list[CalendarEvent]:
+        statement = delete(GoogleCalendarAuth).where(GoogleCalendarAuth.user_id == user_id)
+        result = await self.session.exec(statement)
+        await self.session.flush()
+        return result.rowcount > 0
+
+    async def get_calendar_events(self, user_id: uuid.UUID) -> list[CalendarEvent]:
         """Get all calendar events for a user."""
         statement = select(CalendarEvent).where(CalendarEvent.user_id == user_id)
-        return list(self.session.exec(statement).all())
+        return (await self.session.exec(statement)).all()
 
-    def create_calendar_event(
+    async def create_calendar_event(
         self,
         user_id: uuid.UUID,
         google_event_id: str,
@@ -94,17 +105,27 @@ class CalendarRepository:
             calendar_id=calendar_id,
         )
         self.session.add(event)
-        self.session.commit()
-        self.session.refresh(event)
+        await self.session.flush()
         return event
 
     # Calendar Availability Methods
-    def get_user_availability(self, user_id: uuid.UUID) -> list[Calendar]:
-        """Get all calendar availability for a user."""
-        statement = select(Calendar).where(Calendar.user_id == user_id)
-        return list(self.session.exec(statement).all())
+    async def get_user_availability(self, user_id: uuid.UUID) -> list[Row]:
+        """Get all calendar availability for a user.
+
+        Read-only rows of (id, day_of_week, start_time, end_time), the columns
+        the availability endpoints return.
+        """
+        statement = select(
+            Calendar.id, Calendar.day_of_week, Calendar.start_time, Calendar.end_time
+        ).where(Calendar.user_id == user_id)
+        return (await self.session.exec(statement)).all()
 
-    def create_availability(
+    async def has_availability(self, user_id: uuid.UUID) -> bool:
+        """Check whether a user has any availability, without loading it."""
+        statement = select(exists().where(Calendar.user_id == user_id))
+        return (await self.session.exec(statement)).one()
+
+    async def create_availability(
         self,
         user_id: uuid.UUID,
         day_of_week: int,
@@ -119,11 +140,10 @@ class CalendarRepository:
             end_time=end_time,
         )
         self.session.add(availability)
-        self.session.commit()
-        self.session.refresh(availability)
+        await self.session.flush()
         return availability
 
-    def update_availability(
+    async def update_availability(
         self,
         availability_id: uuid.UUID,
         start_time: str | None = None,
@@ -131,34 +151,40 @@ class CalendarRepository:
     ) -> Optional[Calendar]:
         """Update an availability record."""
         statement = select(Calendar).where(Calendar.id == availability_id)
-        availability = self.session.exec(statement).first()
+        availability = (await self.session.exec(statement)).first()
         if availability:
             if start_time is not None:
                 availability.start_time = start_time
             if end_time is not None:
                 availability.end_time = end_time
             self.session.add(availability)
-            self.session.commit()
-            self.session.refresh(availability)
+            await self.session.flush()
         return availability
 
-    def delete_availability(self, availability_id: uuid.UUID) -> bool:
+    async def delete_availability(self, availability_id: uuid.UUID) -> bool:
         """Delete an availability record."""
-        statement = select(Calendar).where(Calendar.id == availability_id)
-        availability = self.session.exec(statement).first()
-        if availability:
-            self.session.delete(availability)
-            self.session.commit()
-            return True
-        return False
+        statement = delete(Calendar).where(Calendar.id == availability_id)
+        result = await self.session.exec(statement)
+        await self.session.flush()
+        return result.rowcount > 0
 
     # Availability Exception Methods
-    def get_user_exceptions(self, user_id: uuid.UUID) -> list[AvailabilityException]:
-        """Get all availability exceptions for a user."""
-        statement = select(AvailabilityException).where(AvailabilityException.user_id == user_id)
-        return list(self.session.exec(statement).all())
+    async def get_user_exceptions(self, user_id: uuid.UUID) -> list[Row]:
+        """Get all availability exceptions for a user.
+
+        Read-only rows of (id, exception_date, start_time, end_time,
+        is_available), the columns the exceptions endpoint returns.
+        """
+        statement = select(
+            AvailabilityException.id,
+            AvailabilityException.exception_date,
+            AvailabilityException.start_time,
+            AvailabilityException.end_time,
+            AvailabilityException.is_available,
+        ).where(AvailabilityException.user_id == user_id)
+        return (await self.session.exec(statement)).all()
 
-    def create_exception(
+    async def create_exception(
         self,
         user_id: uuid.UUID,
         exception_date: str,
@@ -179,101 +205,142 @@ class CalendarRepository:
             is_available=is_available,
         )
         self.session.add(exception)
-        self.session.commit()
-        self.session.refresh(exception)
+        await self.session.flush()
         return exception
 
-    def delete_exception(self, exception_id: uuid.UUID) -> bool:
+    async def delete_exception(self, exception_id: uuid.UUID) -> bool:
         """Delete an availability exception."""
-        statement = select(AvailabilityException).where(AvailabilityException.id == exception_id)
-        exception = self.session.exec(statement).first()
-        if exception:
-            self.session.delete(exception)
-            self.session.commit()
-            return True
-        return False
+        statement = delete(AvailabilityException).where(AvailabilityException.id == exception_id)
+        result = await self.session.exec(statement)
+        await self.session.flush()
+        return result.rowcount > 0
 
     # Onboarding Methods
-    def get_user_onboarding(self, user_id: uuid.UUID) -> Optional[Onboarding]:
+    async def get_user_onboarding(self, user_id: uuid.UUID) -> Optional[Onboarding]:
         """Get user onboarding status."""
         statement = select(Onboarding).where(Onboarding.user_id == user_id)
-        return self.session.exec(statement).first()
+        return (await self.session.exec(statement)).first()
 
-    def create_onboarding(self, user_id: uuid.UUID) -> Onboarding:
+    async def create_onboarding(self, user_id: uuid.UUID) -> Onboarding:
         """Create onboarding record for a user."""
         onboarding = Onboarding(user_id=user_id)
         self.session.add(onboarding)
-        self.session.commit()
-        self.session.refresh(onboarding)
+        await self.session.flush()
         return onboarding
 
-    def update_onboarding(
+    async def update_onboarding(
         self,
         user_id: uuid.UUID,
         calendar: bool | None = None,
         completed: bool | None = None,
     ) -> Optional[Onboarding]:
-        """Update user onboarding status."""
-        onboarding = self.get_user_onboarding(user_id)
-        if not onboarding:
-            onboarding = self.create_onboarding(user_id)
-        
-        if calendar is not None:
-            onboarding.calendar = calendar
-        if completed is not None:
-            onboarding.completed = completed
-            
-        self.session.add(onboarding)
-        self.session.commit()
-        self.session.refresh(onboarding)
+        """Update user onboarding status, creating the record if needed.
+
+        One upsert: a new row starts from the given flags (False otherwise), and
+        an existing row only has the flags that were passed overwritten.
+        """
+        fields = {
+            name: value
+            for name, value in (("calendar", calendar), ("completed", completed))
+            if value is not None
+        }
+        now = datetime.now(UTC)
+        statement = insert(Onboarding).values(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            calendar=bool(calendar),
+            completed=bool(completed),
+            created_at=now,
+            updated_at=now,
+        )
+        statement = (
+            statement.on_conflict_do_update(
+                index_elements=[Onboarding.user_id],
+                set_={
+                    **{name: statement.excluded[name] for name in fields},
+                    "updated_at": now,
+                },
+            )
+            .returning(Onboarding)
+            .execution_options(populate_existing=True)
+        )
+        onboarding = (await self.session.scalars(statement)).one()
+        await self.session.flush()
         return onboarding
 
-    def create_intervals_for_day(
+    async def create_intervals_for_day(
         self,
         user_id: uuid.UUID,
         day_of_week: int,
         intervals: list[dict[str, str]],
     ) -> list[Calendar]:
-        """Create multiple availability intervals for a day."""
-        # First, delete existing intervals for this day
-        statement = select(Calendar).where(
-            Calendar.user_id == user_id,
-            Calendar.day_of_week == day_of_week
+        """Create multiple availability intervals for a day.
+
+        Diffs against the stored intervals: only rows whose (start_time,
+        end_time) is gone are deleted, only new pairs are inserted, and an
+        unchanged save issues no writes. Ids are generated client-side, so
+        the inserted rows are not refreshed.
+        """
+        existing = (
+            await self.session.exec(
+                select(Calendar).where(
+                    Calendar.user_id == user_id,
+                    Calendar.day_of_week == day_of_week,
+                )
+            )
+        ).all()
+        current = {(row.start_time, row.end_time): row for row in existing}
+        desired = dict.fromkeys(
+            (interval["start_time"], interval["end_time"]) for interval in intervals
         )
-        existing = list(self.session.exec(statement).all())
-        for entry in existing:
-            self.session.delete(entry)
-        
-        # Create new intervals
-        created_intervals = []
-        for interval in intervals:
-            availability = Calendar(
+
+        # Rows repeating a pair that is already tracked are dropped as well.
+        stale_ids = [
+            row.id
+            for row in existing
+            if (row.start_time, row.end_time) not in desired
+            or current[(row.start_time, row.end_time)] is not row
+        ]
+        new_intervals = [
+            Calendar(
                 user_id=user_id,
                 day_of_week=day_of_week,
-                start_time=interval["start_time"],
-                end_time=interval["end_time"],
+                start_time=start_time,
+                end_time=end_time,
             )
-            self.session.add(availability)
-            created_intervals.append(availability)
-        
-        self.session.commit()
-        for interval in created_intervals:
-            self.session.refresh(interval)
-        
-        return created_intervals
-
-    def get_grouped_availability(self, user_id: uuid.UUID) -> dict[int, list[dict[str, str]]]:
-        """Get availability grouped by day of week."""
-        statement = select(Calendar).where(Calendar.user_id == user_id)
-        availability = list(self.session.exec(statement).all())
-        
-        grouped = {}
-        for avail in availability:
-            if avail.day_of_week not in grouped:
-                grouped[avail.day_of_week] = []
-            grouped[avail.day_of_week].append({
-                "start_time": avail.start_time,
-                "end_time": avail.end_time,
-            })
-        
-        return grouped
\ No newline at end of file
+            for start_time, end_time in desired
+            if (start_time, end_time) not in current
+        ]
+        if not stale_ids and not new_intervals:
+            return list(existing)
+
+        if stale_ids:
+            await self.session.exec(
+                delete(Calendar).where(Calendar.id.in_(stale_ids))
+            )
+        self.session.add_all(new_intervals)
+        await self.session.flush()
+
+        kept = [row for key, row in current.items() if key in desired]
+        return kept + new_intervals
+
+    async def get_grouped_availability(self, user_id: uuid.UUID) -> dict[int, list[dict[str, str]]]:
+        """Get availability grouped by day of week.
+
+        PostgreSQL builds each day's interval list with json_agg, so no
+        Calendar objects are hydrated and there is no regrouping in Python.
+        """
+        intervals = func.json_agg(
+            aggregate_order_by(
+                func.json_build_object(
+                    "start_time", Calendar.start_time, "end_time", Calendar.end_time
+                ),
+                Calendar.start_time,
+            )
+        )
+        statement = (
+            select(Calendar.day_of_week, intervals)
+            .where(Calendar.user_id == user_id)
+            .group_by(Calendar.day_of_week)
+        )
+        return dict((await self.session.exec(statement)).all())
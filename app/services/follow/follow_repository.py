@@ -6,76 +6,135 @@ and mutual follow status checks.
 """
 
 import uuid
+from datetime import UTC, datetime
 
-from sqlmodel import Session, and_, func, or_, select
+from sqlalchemy import Row, bindparam
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import and_, delete, exists, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.utils.models import Follow, FollowStatus, User
+from app.utils.exceptions import InvalidRequestError
+from app.utils.models import Follow, FollowStatus, User, UserPublic
 
+# Only what the list endpoints serialize: no ORM hydration, no password hash.
+PUBLIC_USER_COLUMNS = tuple(getattr(User, field) for field in UserPublic.model_fields)
 
-class FollowRepository:
-    def __init__(self, session: Session):
-        self.session = session
 
-    def follow_user(self, follower_id: uuid.UUID, following_id: uuid.UUID) -> Follow:
-        existing = self.session.exec(
-            select(Follow).where(
-                and_(
-                    Follow.follower_id == follower_id,
-                    Follow.following_id == following_id,
-                )
-            )
-        ).first()
+def _follow_columns(other_user_id) -> tuple:
+    """Follow columns for a list row, labelled apart from the joined user's."""
+    return (
+        Follow.id.label("follow_id"),
+        other_user_id,
+        Follow.created_at.label("follow_created_at"),
+        Follow.updated_at.label("follow_updated_at"),
+    )
 
-        if existing:
-            raise ValueError("Already following this user")
 
-        if follower_id == following_id:
-            raise ValueError("Cannot follow yourself")
+# Hot reads are built once with bind parameters, so each call only binds
+# values instead of rebuilding the expression tree.
+_FOLLOW_STATUS = select(
+    exists().where(
+        and_(
+            Follow.follower_id == bindparam("user_id"),
+            Follow.following_id == bindparam("target_id"),
+        )
+    ),
+    exists().where(
+        and_(
+            Follow.follower_id == bindparam("target_id"),
+            Follow.following_id == bindparam("user_id"),
+        )
+    ),
+)
+
+# Both counts as scalar subqueries: one round trip, each on its own index.
+# count(*) reads no column, so each can be an index-only scan.
+_FOLLOW_COUNTS = select(
+    select(func.count())
+    .select_from(Follow)
+    .where(Follow.follower_id == bindparam("user_id"))
+    .scalar_subquery(),
+    select(func.count())
+    .select_from(Follow)
+    .where(Follow.following_id == bindparam("user_id"))
+    .scalar_subquery(),
+)
+
+
+class FollowRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
 
-        follow = Follow(follower_id=follower_id, following_id=following_id)
-        self.session.add(follow)
-        self.session.commit()
-        self.session.refresh(follow)
+    async def follow_user(
+        self, follower_id: uuid.UUID, following_id: uuid.UUID
+    ) -> Follow:
+        if follower_id == following_id:
+            raise InvalidRequestError("Cannot follow yourself")
+
+        # The unique (follower_id, following_id) constraint decides duplicates,
+        # so there is no read-then-insert race.
+        now = datetime.now(UTC)
+        statement = (
+            insert(Follow)
+            .values(
+                id=uuid.uuid4(),
+                follower_id=follower_id,
+                following_id=following_id,
+                created_at=now,
+                updated_at=now,
+            )
+            .on_conflict_do_nothing(index_elements=["follower_id", "following_id"])
+            .returning(Follow)
+        )
+        follow = (await self.session.scalars(statement)).first()
+        if follow is None:
+            raise InvalidRequestError("Already following this user")
+        # Committed here, not at request teardown: the route drops the cached
+        # status and counts next, and a read in between must not re-cache the
+        # old state.
+        await self.session.commit()
         return follow
 
-    def unfollow_user(self, follower_id: uuid.UUID, following_id: uuid.UUID) -> bool:
-        follow = self.session.exec(
-            select(Follow).where(
+    async def unfollow_user(
+        self, follower_id: uuid.UUID, following_id: uuid.UUID
+    ) -> bool:
+        result = await self.session.exec(
+            delete(Follow).where(
                 and_(
                     Follow.follower_id == follower_id,
                     Follow.following_id == following_id,
                 )
             )
-        ).first()
-
-        if not follow:
-            return False
-
-        self.session.delete(follow)
-        self.session.commit()
-        return True
-
-    def get_following(self, user_id: uuid.UUID, skip: int = 0, limit: int = 20):
-        following = self.session.exec(
-            select(Follow, User)
+        )
+        # Committed before the route invalidates the cache; see follow_user.
+        await self.session.commit()
+        return result.rowcount > 0
+
+    async def get_following(
+        self, user_id: uuid.UUID, skip: int = 0, limit: int = 20
+    ) -> list[Row]:
+        result = await self.session.exec(
+            select(*_follow_columns(Follow.following_id), *PUBLIC_USER_COLUMNS)
             .join(User, Follow.following_id == User.id)
             .where(Follow.follower_id == user_id)
             .offset(skip)
             .limit(limit)
-        ).all()
-        return list(following)
+        )
+        return result.all()
 
-    def get_followers(self, user_id: uuid.UUID, skip: int = 0, limit: int = 20):
-        followers = self.session.exec(
-            select(Follow, User)
+    async def get_followers(
+        self, user_id: uuid.UUID, skip: int = 0, limit: int = 20
+    ) -> list[Row]:
+        result = await self.session.exec(
+            select(*_follow_columns(Follow.follower_id), *PUBLIC_USER_COLUMNS)
             .join(User, Follow.follower_id == User.id)
             .where(Follow.following_id == user_id)
             .offset(skip)
             .limit(limit)
-        ).all()
-        return list(followers)
+        )
+        return result.all()
 
-    def get_follow_status(
+    async def get_follow_status(
         self, user_id: uuid.UUID, target_user_id: uuid.UUID
     ) -> FollowStatus:
         if user_id == target_user_id:
@@ -83,29 +142,11 @@ class FollowRepository:
                 is_following=False, is_followed_by=False, is_mutual=False
             )
 
-        follows = self.session.exec(
-            select(Follow.follower_id, Follow.following_id).where(
-                or_(
-                    and_(
-                        Follow.follower_id == user_id,
-                        Follow.following_id == target_user_id,
-                    ),
-                    and_(
-                        Follow.follower_id == target_user_id,
-                        Follow.following_id == user_id,
-                    ),
-                )
+        is_following, is_followed_by = (
+            await self.session.exec(
+                _FOLLOW_STATUS, params={"user_id": user_id, "target_id": target_user_id}
             )
-        ).all()
-
-        is_following = any(
-            f.follower_id == user_id and f.following_id == target_user_id
-            for f in follows
-        )
-        is_followed_by = any(
-            f.follower_id == target_user_id and f.following_id == user_id
-            for f in follows
-        )
+        ).one()
 
         return FollowStatus(
             is_following=is_following,
@@ -113,20 +154,14 @@ class FollowRepository:
             is_mutual=is_following and is_followed_by,
         )
 
-    def get_follow_counts(self, user_id: uuid.UUID) -> tuple[int, int]:
+    async def get_follow_counts(self, user_id: uuid.UUID) -> tuple[int, int]:
         """Get follower and following counts for a user.
         
         Returns:
             tuple[int, int]: (following_count, followers_count)
         """
-        # Count how many users this user is following
-        following_count = self.session.exec(
-            select(func.count(Follow.id)).where(Follow.follower_id == user_id)
+        following_count, followers_count = (
+            await self.session.exec(_FOLLOW_COUNTS, params={"user_id": user_id})
         ).one()
-        
-        # Count how many users are following this user
-        followers_count = self.session.exec(
-            select(func.count(Follow.id)).where(Follow.following_id == user_id)
-        ).one()
-        
+
         return following_count, followers_count
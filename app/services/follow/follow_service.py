@@ -6,38 +6,46 @@ follower/following list retrieval, and relationship status checks.
 
 import uuid
 
+from sqlalchemy import Row
+
 from app.services.follow.follow_repository import FollowRepository
-from app.utils.models import FollowerListPublic, FollowCountStatus, FollowingListPublic, FollowStatus
+from app.utils.models import Follow, FollowCountStatus, FollowStatus
 
 
 class FollowService:
     def __init__(self, follow_repository: FollowRepository):
         self.follow_repository = follow_repository
 
-    def unfollow_user(self, follower_id: uuid.UUID, following_id: uuid.UUID) -> bool:
-        return self.follow_repository.unfollow_user(follower_id, following_id)
+    async def unfollow_user(
+        self, follower_id: uuid.UUID, following_id: uuid.UUID
+    ) -> bool:
+        return await self.follow_repository.unfollow_user(follower_id, following_id)
 
-    def follow_user(self, follower_id: uuid.UUID, following_id: uuid.UUID) -> bool:
-        return self.follow_repository.follow_user(follower_id, following_id)
+    async def follow_user(
+        self, follower_id: uuid.UUID, following_id: uuid.UUID
+    ) -> Follow:
+        return await self.follow_repository.follow_user(follower_id, following_id)
 
-    def get_following_list(
+    async def get_following_list(
         self, user_id: uuid.UUID, skip: int = 0, limit: int = 20
-    ) -> list[FollowingListPublic]:
-        return self.follow_repository.get_following(user_id, skip, limit)
+    ) -> list[Row]:
+        return await self.follow_repository.get_following(user_id, skip, limit)
 
-    def get_followers_list(
+    async def get_followers_list(
         self, user_id: uuid.UUID, skip: int = 0, limit: int = 20
-    ) -> list[FollowerListPublic]:
-        return self.follow_repository.get_followers(user_id, skip, limit)
+    ) -> list[Row]:
+        return await self.follow_repository.get_followers(user_id, skip, limit)
 
-    def get_follow_status(
+    async def get_follow_status(
         self, user_id: uuid.UUID, target_user_id: uuid.UUID
     ) -> FollowStatus:
-        return self.follow_repository.get_follow_status(user_id, target_user_id)
+        return await self.follow_repository.get_follow_status(user_id, target_user_id)
 
-    def get_follow_counts(self, user_id: uuid.UUID) -> FollowCountStatus:
+    async def get_follow_counts(self, user_id: uuid.UUID) -> FollowCountStatus:
         """Get follower and following counts for a user."""
-        following_count, followers_count = self.follow_repository.get_follow_counts(user_id)
+        following_count, followers_count = (
+            await self.follow_repository.get_follow_counts(user_id)
+        )
         return FollowCountStatus(
             following_count=following_count,
             followers_count=followers_count
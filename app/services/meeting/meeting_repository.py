@@ -8,11 +8,26 @@ updates, deletions, and filtered queries with optimized joins.
 import uuid
 from datetime import UTC, datetime
 
-from sqlmodel import Session, and_, desc, func, or_, select
+from sqlalchemy import lambda_stmt
+from sqlalchemy.orm import raiseload, selectinload
+from sqlmodel import (
+    and_,
+    delete,
+    desc,
+    exists,
+    func,
+    insert,
+    select,
+    tuple_,
+    update,
+)
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.utils.exceptions import InvalidRequestError
 from app.utils.models import (
     Meeting,
     MeetingObject,
+    MeetingStatus,
     MeetingType,
     MeetingTypeBase,
     Participant,
@@ -21,88 +36,130 @@ from app.utils.models import (
     User,
 )
 
+# MeetingPublic/ParticipantPublic serialize these relationships. Lazy loading
+# is not available on an AsyncSession, so queries feeding them load up front;
+# everything else (owner, appointed_by_user, ...) raises instead of querying.
+MEETING_LOAD_OPTIONS = (
+    selectinload(Meeting.meeting_type).raiseload("*"),
+    selectinload(Meeting.participants).options(
+        selectinload(Participant.user).raiseload("*"),
+        raiseload("*"),
+    ),
+    raiseload("*"),
+)
+PARTICIPANT_LOAD_OPTIONS = (
+    selectinload(Participant.user).raiseload("*"),
+    raiseload("*"),
+)
+
+
+def _owned_or_accepted_ids(user_id: uuid.UUID, window):
+    """Ids of meetings in window the user owns or has accepted.
+
+    A UNION of the owner and participant sides lets each use its own index,
+    where OR across an outer join forces a DISTINCT over the joined rows.
+    """
+    owned = select(Meeting.id).where(Meeting.owner_id == user_id, window)
+    accepted = (
+        select(Meeting.id)
+        .join(Participant, Meeting.id == Participant.meeting_id)
+        .where(
+            Participant.user_id == user_id,
+            Participant.status == ParticipantStatus.ACCEPTED,
+            window,
+        )
+    )
+    return owned.union(accepted).subquery()
+
+
+# The list queries below are wrapped in lambda_stmt so the statement is built
+# and cache-keyed once per shape; later calls only rebind the closure values.
+
 
 class MeetingRepository:
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
-    def create_meeting_with_participants(
+    async def create_meeting_with_participants(
         self, meeting_dict: dict, participants: list[ParticipantObject]
     ) -> Meeting:
         try:
+            # One IN query validates every participant instead of a get per row.
+            user_ids = {p.user_id for p in participants}
+            existing_ids = set(
+                await self.session.exec(select(User.id).where(User.id.in_(user_ids)))
+            )
+            if existing_ids != user_ids:
+                raise InvalidRequestError("User does not exist")
+
             meeting = Meeting(**meeting_dict)
             self.session.add(meeting)
-            self.session.flush()
-
-            for participant_data in participants:
-                user = self.session.get(User, participant_data.user_id)
-                if not user:
-                    raise ValueError("User does not exist")
-
-                participant = Participant(
-                    meeting_id=meeting.id,
-                    user_id=participant_data.user_id,
-                    status=participant_data.status,
-                )
-                self.session.add(participant)
-
-            self.session.commit()
-            self.session.refresh(meeting)
-            return meeting
+            await self.session.flush()
+
+            # Core-level insert skips the unit of work, so defaults are filled here.
+            now = datetime.now(UTC)
+            rows = [
+                {
+                    "id": uuid.uuid4(),
+                    "meeting_id": meeting.id,
+                    "user_id": participant_data.user_id,
+                    "status": participant_data.status,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for participant_data in participants
+            ]
+            if rows:
+                await self.session.execute(insert(Participant), rows)
+
+            await self.session.commit()
+            return await self.get_meeting_with_details(meeting.id)
 
         except Exception:
-            self.session.rollback()
+            await self.session.rollback()
             raise
 
-    def get_user_meetings(
+    async def _fetch_page(
+        self, query, count_query=None, after_cursor: bool = False
+    ) -> tuple[list[Meeting], int | None]:
+        """Run a list query, counting matches in the same round trip when possible.
+
+        Without a cursor the page query already sees every match, so
+        COUNT(*) OVER () returns the total alongside the rows. A cursor
+        narrows the window, so later pages still run count_query.
+        """
+        if count_query is None or after_cursor:
+            total_count = None
+            if count_query is not None:
+                total_count = (await self.session.exec(count_query)).one()
+            meetings = list((await self.session.exec(query)).scalars().all())
+            return meetings, total_count
+
+        query += lambda s: s.add_columns(func.count().over().label("total_count"))
+        rows = (await self.session.exec(query)).all()
+        return [row.Meeting for row in rows], rows[0].total_count if rows else 0
+
+    async def get_user_meetings(
         self,
         user_id: uuid.UUID,
-        skip: int = 0,
+        cursor: tuple[datetime, uuid.UUID] | None = None,
         limit: int = 100,
         include_as_participant: bool = True,
-    ) -> tuple[list[Meeting], int]:
+        include_count: bool = False,
+    ) -> tuple[list[Meeting], int | None]:
         now = datetime.now(UTC)
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
         if include_as_participant:
             # Include meetings where user is owner OR participant (with ACCEPTED status)
-            count_query = (
-                select(func.count(func.distinct(Meeting.id)))
-                .select_from(Meeting)
-                .outerjoin(Participant, Meeting.id == Participant.meeting_id)
-                .where(
-                    and_(
-                        Meeting.start_time >= today_start,
-                        or_(
-                            Meeting.owner_id == user_id,
-                            and_(
-                                Participant.user_id == user_id,
-                                Participant.status == ParticipantStatus.ACCEPTED
-                            )
-                        )
-                    )
-                )
-            )
-            total_count = self.session.exec(count_query).one()
-
-            query = (
-                select(Meeting)
-                .outerjoin(Participant, Meeting.id == Participant.meeting_id)
-                .where(
-                    and_(
-                        Meeting.start_time >= today_start,
-                        or_(
-                            Meeting.owner_id == user_id,
-                            and_(
-                                Participant.user_id == user_id,
-                                Participant.status == ParticipantStatus.ACCEPTED
-                            )
-                        )
-                    )
-                )
-                .order_by(Meeting.start_time)
-                .distinct()
-                .offset(skip)
+            meeting_ids = _owned_or_accepted_ids(user_id, Meeting.start_time >= today_start)
+            count_query = select(func.count()).select_from(meeting_ids)
+
+            query = lambda_stmt(
+                lambda: select(Meeting)
+                .where(Meeting.id.in_(select(meeting_ids.c.id)))
+                .options(*MEETING_LOAD_OPTIONS)
+                .order_by(Meeting.start_time, Meeting.id)
                 .limit(limit)
             )
         else:
@@ -110,67 +167,46 @@ class MeetingRepository:
             count_query = select(func.count(Meeting.id)).where(
                 and_(Meeting.owner_id == user_id, Meeting.start_time >= today_start)
             )
-            total_count = self.session.exec(count_query).one()
 
-            query = (
-                select(Meeting)
+            query = lambda_stmt(
+                lambda: select(Meeting)
                 .where(and_(Meeting.owner_id == user_id, Meeting.start_time >= today_start))
-                .order_by(Meeting.start_time)
-                .offset(skip)
+                .options(*MEETING_LOAD_OPTIONS)
+                .order_by(Meeting.start_time, Meeting.id)
                 .limit(limit)
             )
 
-        meetings = list(self.session.exec(query).all())
-        return meetings, total_count
+        if cursor:
+            # Keyset: resume strictly after the last row of the previous page.
+            cursor_value, cursor_id = cursor
+            query += lambda s: s.where(
+                tuple_(Meeting.start_time, Meeting.id) > tuple_(cursor_value, cursor_id)
+            )
+
+        return await self._fetch_page(
+            query, count_query if include_count else None, after_cursor=bool(cursor)
+        )
 
-    def get_past_meetings(
+    async def get_past_meetings(
         self,
         user_id: uuid.UUID,
-        skip: int = 0,
+        cursor: tuple[datetime, uuid.UUID] | None = None,
         limit: int = 100,
         include_as_participant: bool = True,
-    ) -> tuple[list[Meeting], int]:
+        include_count: bool = False,
+    ) -> tuple[list[Meeting], int | None]:
         now = datetime.now(UTC)
 
         if include_as_participant:
             # Include meetings where user is owner OR participant (with ACCEPTED status)
-            count_query = (
-                select(func.count(func.distinct(Meeting.id)))
-                .select_from(Meeting)
-                .outerjoin(Participant, Meeting.id == Participant.meeting_id)
-                .where(
-                    and_(
-                        Meeting.start_time < now,
-                        or_(
-                            Meeting.owner_id == user_id,
-                            and_(
-                                Participant.user_id == user_id,
-                                Participant.status == ParticipantStatus.ACCEPTED
-                            )
-                        )
-                    )
-                )
-            )
-            total_count = self.session.exec(count_query).one()
-
-            query = (
-                select(Meeting)
-                .outerjoin(Participant, Meeting.id == Participant.meeting_id)
-                .where(
-                    and_(
-                        Meeting.start_time < now,
-                        or_(
-                            Meeting.owner_id == user_id,
-                            and_(
-                                Participant.user_id == user_id,
-                                Participant.status == ParticipantStatus.ACCEPTED
-                            )
-                        )
-                    )
-                )
-                .order_by(desc(Meeting.start_time))
-                .distinct()
-                .offset(skip)
+            meeting_ids = _owned_or_accepted_ids(user_id, Meeting.start_time < now)
+            count_query = select(func.count()).select_from(meeting_ids)
+
+            query = lambda_stmt(
+                lambda: select(Meeting)
+                .where(Meeting.id.in_(select(meeting_ids.c.id)))
+                .options(*MEETING_LOAD_OPTIONS)
+                .order_by(desc(Meeting.start_time), desc(Meeting.id))
                 .limit(limit)
             )
         else:
@@ -178,22 +214,32 @@ class MeetingRepository:
             count_query = select(func.count(Meeting.id)).where(
                 and_(Meeting.owner_id == user_id, Meeting.start_time < now)
             )
-            total_count = self.session.exec(count_query).one()
 
-            query = (
-                select(Meeting)
+            query = lambda_stmt(
+                lambda: select(Meeting)
                 .where(and_(Meeting.owner_id == user_id, Meeting.start_time < now))
-                .order_by(desc(Meeting.start_time))
-                .offset(skip)
+                .options(*MEETING_LOAD_OPTIONS)
+                .order_by(desc(Meeting.start_time), desc(Meeting.id))
                 .limit(limit)
             )
 
-        meetings = list(self.session.exec(query).all())
-        return meetings, total_count
+        if cursor:
+            cursor_value, cursor_id = cursor
+            query += lambda s: s.where(
+                tuple_(Meeting.start_time, Meeting.id) < tuple_(cursor_value, cursor_id)
+            )
+
+        return await self._fetch_page(
+            query, count_query if include_count else None, after_cursor=bool(cursor)
+        )
 
-    def get_user_meeting_requests(
-        self, user_id: uuid.UUID, skip: int = 0, limit: int = 100
-    ) -> tuple[list[Meeting], int]:
+    async def get_user_meeting_requests(
+        self,
+        user_id: uuid.UUID,
+        cursor: tuple[datetime, uuid.UUID] | None = None,
+        limit: int = 100,
+        include_count: bool = False,
+    ) -> tuple[list[Meeting], int | None]:
         """Get meetings where user has pending invitations (status = NEW)."""
         count_query = (
             select(func.count())
@@ -206,10 +252,9 @@ class MeetingRepository:
                 )
             )
         )
-        total_count = self.session.exec(count_query).one()
 
-        query = (
-            select(Meeting)
+        query = lambda_stmt(
+            lambda: select(Meeting)
             .join(Participant)
             .where(
                 and_(
@@ -217,61 +262,77 @@ class MeetingRepository:
                     Participant.status == ParticipantStatus.NEW,
                 )
             )
-            .order_by(desc(Meeting.created_at))
-            .offset(skip)
+            .options(*MEETING_LOAD_OPTIONS)
+            .order_by(desc(Meeting.created_at), desc(Meeting.id))
             .limit(limit)
         )
 
-        meetings = list(self.session.exec(query).all())
-        return meetings, total_count
+        if cursor:
+            cursor_value, cursor_id = cursor
+            query += lambda s: s.where(
+                tuple_(Meeting.created_at, Meeting.id) < tuple_(cursor_value, cursor_id)
+            )
 
-    def update_participant_status(
+        return await self._fetch_page(
+            query, count_query if include_count else None, after_cursor=bool(cursor)
+        )
+
+    async def update_participant_status(
         self, meeting_id: uuid.UUID, user_id: uuid.UUID, status: ParticipantStatus
     ) -> Participant | None:
-        participant = self.session.exec(
-            select(Participant).where(
-                and_(
-                    Participant.meeting_id == meeting_id, Participant.user_id == user_id
+        participant = (
+            await self.session.exec(
+                update(Participant)
+                .where(
+                    and_(
+                        Participant.meeting_id == meeting_id,
+                        Participant.user_id == user_id,
+                    )
                 )
+                .values(status=status, updated_at=datetime.now(UTC))
+                .returning(Participant)
+                .options(*PARTICIPANT_LOAD_OPTIONS)
+                .execution_options(populate_existing=True)
             )
-        ).first()
-
-        if not participant:
-            return None
-
-        participant.status = status
-        participant.updated_at = datetime.now(UTC)
-
-        self.session.add(participant)
-        self.session.commit()
-        self.session.refresh(participant)
+        ).scalar_one_or_none()
+        await self.session.commit()
         return participant
 
-    def get_meeting_by_id(self, meeting_id: uuid.UUID) -> Meeting | None:
-        return self.session.get(Meeting, meeting_id)
+    async def get_meeting_by_id(self, meeting_id: uuid.UUID) -> Meeting | None:
+        return await self.session.get(Meeting, meeting_id)
 
-    def add_participant(
+    async def get_meeting_with_details(self, meeting_id: uuid.UUID) -> Meeting | None:
+        """Get a meeting with its type and participants (and their users) loaded."""
+        return await self.session.get(
+            Meeting,
+            meeting_id,
+            options=MEETING_LOAD_OPTIONS,
+            populate_existing=True,
+        )
+
+    async def add_participant(
         self, meeting_id: uuid.UUID, participant_data: ParticipantObject
     ) -> Participant | None:
-        meeting = self.session.get(Meeting, meeting_id)
-        if not meeting:
-            return None
-
-        user = self.session.get(User, participant_data.user_id)
-        if not user:
-            return None
-
-        existing = self.session.exec(
-            select(Participant).where(
-                and_(
-                    Participant.meeting_id == meeting_id,
-                    Participant.user_id == participant_data.user_id,
+        # All three pre-flight checks in one round trip.
+        meeting_exists, user_exists, already_invited = (
+            await self.session.exec(
+                select(
+                    exists().where(Meeting.id == meeting_id),
+                    exists().where(User.id == participant_data.user_id),
+                    exists().where(
+                        and_(
+                            Participant.meeting_id == meeting_id,
+                            Participant.user_id == participant_data.user_id,
+                        )
+                    ),
                 )
             )
-        ).first()
+        ).one()
+        if not meeting_exists or not user_exists:
+            return None
 
-        if existing:
-            raise ValueError("User is already a participant in this meeting")
+        if already_invited:
+            raise InvalidRequestError("User is already a participant in this meeting")
 
         db_participant = Participant(
             meeting_id=meeting_id,
@@ -282,14 +343,68 @@ class MeetingRepository:
         )
 
         self.session.add(db_participant)
-        self.session.commit()
-        self.session.refresh(db_participant)
-        return db_participant
+        await self.session.commit()
+        return await self.get_participant_with_user(db_participant.id)
+
+    async def add_participants(
+        self, meeting_id: uuid.UUID, participants: list[ParticipantObject]
+    ) -> list[Participant]:
+        """Add several participants with one validation pass and one INSERT."""
+        user_ids = {p.user_id for p in participants}
+        if len(user_ids) != len(participants):
+            raise InvalidRequestError("Duplicate participants in request")
+
+        existing_ids = set(
+            await self.session.exec(select(User.id).where(User.id.in_(user_ids)))
+        )
+        if existing_ids != user_ids:
+            raise InvalidRequestError("User does not exist")
+
+        already_invited = (
+            await self.session.exec(
+                select(Participant.id).where(
+                    and_(
+                        Participant.meeting_id == meeting_id,
+                        Participant.user_id.in_(user_ids),
+                    )
+                )
+            )
+        ).first()
+        if already_invited:
+            raise InvalidRequestError("User is already a participant in this meeting")
+
+        # Core-level insert skips the unit of work, so defaults are filled here.
+        now = datetime.now(UTC)
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "meeting_id": meeting_id,
+                "user_id": participant_data.user_id,
+                "status": participant_data.status,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for participant_data in participants
+        ]
+        try:
+            await self.session.execute(insert(Participant), rows)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        statement = (
+            select(Participant)
+            .where(Participant.id.in_([row["id"] for row in rows]))
+            .options(*PARTICIPANT_LOAD_OPTIONS)
+            .order_by(Participant.created_at, Participant.id)
+        )
+        return list((await self.session.exec(statement)).all())
 
-    def update_meeting(
+    async def update_meeting(
         self, meeting_id: uuid.UUID, meeting_data: MeetingObject | dict
     ) -> Meeting | None:
-        db_meeting = self.session.get(Meeting, meeting_id)
+        db_meeting = await self.session.get(Meeting, meeting_id)
         if not db_meeting:
             return None
 
@@ -304,100 +419,123 @@ class MeetingRepository:
             setattr(db_meeting, field, value)
 
         self.session.add(db_meeting)
-        self.session.commit()
-        self.session.refresh(db_meeting)
-        return db_meeting
-
-    def delete_meeting(self, meeting_id: uuid.UUID) -> bool:
-        db_meeting = self.session.get(Meeting, meeting_id)
-        if not db_meeting:
-            return False
-
-        participants = self.session.exec(
-            select(Participant).where(Participant.meeting_id == meeting_id)
-        ).all()
+        await self.session.commit()
+        return await self.get_meeting_with_details(meeting_id)
+
+    async def set_meeting_status(
+        self, meeting_id: uuid.UUID, status: MeetingStatus
+    ) -> bool:
+        """Set a meeting's status in one UPDATE; no-op if it already has it."""
+        result = await self.session.exec(
+            update(Meeting)
+            .where(and_(Meeting.id == meeting_id, Meeting.status != status))
+            .values(status=status, updated_at=datetime.now(UTC))
+        )
+        await self.session.commit()
+        return result.rowcount > 0
 
-        for participant in participants:
-            self.session.delete(participant)
+    async def delete_meeting(self, meeting_id: uuid.UUID) -> bool:
+        # Two set-based DELETEs: participants are never loaded one by one.
+        await self.session.exec(
+            delete(Participant).where(Participant.meeting_id == meeting_id)
+        )
+        result = await self.session.exec(
+            delete(Meeting).where(Meeting.id == meeting_id)
+        )
+        await self.session.commit()
+        return result.rowcount > 0
 
-        self.session.delete(db_meeting)
-        self.session.commit()
-        return True
+    async def get_participant_by_id(
+        self, participant_id: uuid.UUID
+    ) -> Participant | None:
+        return await self.session.get(Participant, participant_id)
 
-    def get_participant_by_id(self, participant_id: uuid.UUID) -> Participant | None:
-        return self.session.get(Participant, participant_id)
+    async def get_participant_with_user(
+        self, participant_id: uuid.UUID
+    ) -> Participant | None:
+        """Get a participant with its user loaded."""
+        return await self.session.get(
+            Participant,
+            participant_id,
+            options=PARTICIPANT_LOAD_OPTIONS,
+            populate_existing=True,
+        )
 
-    def delete_participant_by_id(self, participant_id: uuid.UUID) -> bool:
-        participant = self.session.get(Participant, participant_id)
+    async def delete_participant_by_id(self, participant_id: uuid.UUID) -> bool:
+        participant = await self.session.get(Participant, participant_id)
         if not participant:
             return False
 
-        self.session.delete(participant)
-        self.session.commit()
+        await self.session.delete(participant)
+        await self.session.commit()
         return True
 
-    def get_meeting_participants(self, meeting_id: uuid.UUID) -> list[Participant]:
+    async def get_meeting_participants(
+        self, meeting_id: uuid.UUID
+    ) -> list[Participant]:
         """Get all participants for a meeting."""
         statement = select(Participant).where(Participant.meeting_id == meeting_id)
-        return list(self.session.exec(statement).all())
+        return list((await self.session.exec(statement)).all())
 
     # ============================================================
     # MEETING TYPE METHODS
     # ============================================================
 
-    def create_meeting_type(self, meeting_type_data: MeetingTypeBase) -> MeetingType:
+    async def create_meeting_type(
+        self, meeting_type_data: MeetingTypeBase
+    ) -> MeetingType:
         """Create a new meeting type in the database."""
         meeting_type = MeetingType.model_validate(meeting_type_data)
         self.session.add(meeting_type)
-        self.session.commit()
-        self.session.refresh(meeting_type)
+        await self.session.commit()
         return meeting_type
 
-    def get_meeting_type_by_id(self, meeting_type_id: uuid.UUID) -> MeetingType | None:
+    async def get_meeting_type_by_id(
+        self, meeting_type_id: uuid.UUID
+    ) -> MeetingType | None:
         """Get a meeting type by ID."""
-        return self.session.get(MeetingType, meeting_type_id)
+        return await self.session.get(MeetingType, meeting_type_id)
 
-    def get_meeting_type_by_title(self, title: str) -> MeetingType | None:
+    async def get_meeting_type_by_title(self, title: str) -> MeetingType | None:
         """Get a meeting type by title."""
         statement = select(MeetingType).where(MeetingType.title == title)
-        return self.session.exec(statement).first()
+        return (await self.session.exec(statement)).first()
 
-    def list_meeting_types(self) -> list[MeetingType]:
+    async def list_meeting_types(self) -> list[MeetingType]:
         """List all meeting types."""
         statement = select(MeetingType).order_by(MeetingType.title)
-        return list(self.session.exec(statement).all())
+        return list((await self.session.exec(statement)).all())
 
-    def update_meeting_type(
+    async def update_meeting_type(
         self, meeting_type_id: uuid.UUID, meeting_type_data: MeetingTypeBase
     ) -> MeetingType:
         """Update a meeting type."""
-        meeting_type = self.session.get(MeetingType, meeting_type_id)
+        meeting_type = await self.session.get(MeetingType, meeting_type_id)
 
         if not meeting_type:
-            raise ValueError("Meeting type not found")
+            raise InvalidRequestError("Meeting type not found")
 
         # Update fields
         for field, value in meeting_type_data.model_dump(exclude_unset=True).items():
             setattr(meeting_type, field, value)
 
         self.session.add(meeting_type)
-        self.session.commit()
-        self.session.refresh(meeting_type)
+        await self.session.commit()
         return meeting_type
 
-    def delete_meeting_type(self, meeting_type_id: uuid.UUID) -> bool:
+    async def delete_meeting_type(self, meeting_type_id: uuid.UUID) -> bool:
         """Delete a meeting type."""
-        meeting_type = self.session.get(MeetingType, meeting_type_id)
+        meeting_type = await self.session.get(MeetingType, meeting_type_id)
 
         if not meeting_type:
             return False
 
-        self.session.delete(meeting_type)
-        self.session.commit()
+        await self.session.delete(meeting_type)
+        await self.session.commit()
         return True
 
-    def is_meeting_type_in_use(self, meeting_type_id: uuid.UUID) -> bool:
+    async def is_meeting_type_in_use(self, meeting_type_id: uuid.UUID) -> bool:
         """Check if a meeting type is currently in use by any meetings."""
         statement = select(Meeting).where(Meeting.type_id == meeting_type_id)
-        result = self.session.exec(statement).first()
+        result = (await self.session.exec(statement)).first()
         return result is not None
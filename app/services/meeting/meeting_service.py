@@ -4,14 +4,17 @@ Implements business logic and validation for meetings and participants,
 including creation, updates, deletions, and access control.
 """
 
+import base64
 import uuid
 from datetime import UTC, datetime
 
 from app.services.meeting.meeting_repository import MeetingRepository
+from app.utils.exceptions import InvalidRequestError, NotFoundError
 from app.utils.models import (
     MeetingCreate,
     MeetingObject,
     MeetingPublic,
+    MeetingsPublic,
     MeetingStatus,
     MeetingTypeBase,
     MeetingTypePublic,
@@ -19,159 +22,231 @@ from app.utils.models import (
     ParticipantPublic,
     ParticipantStatus,
 )
+from app.utils.ttlcache import TTLCache
+
+# Meeting types are reference data. Writes in this process clear the cache;
+# other workers pick changes up once their entries expire.
+_meeting_type_cache = TTLCache(ttl=60, maxsize=512)
+
+
+def _encode_cursor(sort_value: datetime, meeting_id: uuid.UUID) -> str:
+    """Encode the (sort column, id) of the last row on a page as an opaque cursor."""
+    raw = f"{sort_value.isoformat()}|{meeting_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a cursor from _encode_cursor, raising INVALID_CURSOR if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        sort_value, meeting_id = raw.split("|")
+        return datetime.fromisoformat(sort_value), uuid.UUID(meeting_id)
+    except ValueError:
+        raise InvalidRequestError("INVALID_CURSOR")
+
+
+def _paginate(
+    meetings: list[MeetingPublic], limit: int, sort_field: str = "start_time"
+) -> MeetingsPublic:
+    """Trim the limit + 1 probe row and derive the next cursor from the last row."""
+    if len(meetings) <= limit:
+        return MeetingsPublic(data=meetings, next_cursor=None)
+
+    page = meetings[:limit]
+    last = page[-1]
+    return MeetingsPublic(
+        data=page,
+        has_more=True,
+        next_cursor=_encode_cursor(getattr(last, sort_field), last.id),
+    )
 
 
 class MeetingService:
     def __init__(self, repository: MeetingRepository):
         self.repository = repository
 
-    def create_meeting_with_participants(
+    async def create_meeting_with_participants(
         self, meeting_with_participants: MeetingCreate, owner_id: uuid.UUID
     ) -> MeetingPublic:
         meeting = meeting_with_participants.meeting
         now = datetime.now(UTC)
 
         if meeting.start_time <= now:
-            raise ValueError("MUST_BE_IN_FUTURE")
+            raise InvalidRequestError("MUST_BE_IN_FUTURE")
 
         participant_user_ids = {
             p.user_id for p in meeting_with_participants.participants
         }
         if owner_id in participant_user_ids:
-            raise ValueError("CANNOT_ADD_YOURSELF")
+            raise InvalidRequestError("CANNOT_ADD_YOURSELF")
 
         if not participant_user_ids:
-            raise ValueError("MUST_ADD_PARTICIPANT")
+            raise InvalidRequestError("MUST_ADD_PARTICIPANT")
 
-        meeting_type = self.repository.get_meeting_type_by_title(meeting.type)
-        if not meeting_type:
-            meeting_type_data = MeetingTypeBase(title=meeting.type)
-            meeting_type = self.repository.create_meeting_type(meeting_type_data)
+        meeting_type_id = await self._resolve_meeting_type_id(meeting.type)
 
         meeting_data = meeting.model_dump()
         meeting_data["owner_id"] = owner_id
         # Replace 'type' with 'type_id'
         meeting_data.pop("type", None)  # Remove the type string
-        meeting_data["type_id"] = meeting_type.id  # Add the type_id UUID
+        meeting_data["type_id"] = meeting_type_id  # Add the type_id UUID
 
         participants = list(meeting_with_participants.participants) + [
             ParticipantObject(user_id=owner_id, status=ParticipantStatus.ACCEPTED)
         ]
 
-        db_meeting = self.repository.create_meeting_with_participants(
+        db_meeting = await self.repository.create_meeting_with_participants(
             meeting_data, participants
         )
 
         return MeetingPublic.model_validate(db_meeting)
 
-    def get_user_meetings(
+    async def get_user_meetings(
         self,
         user_id: uuid.UUID,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 100,
         include_as_participant: bool = True,
-    ) -> tuple[list[MeetingPublic], int]:
-        meetings, total_count = self.repository.get_user_meetings(
+        include_count: bool = False,
+    ) -> tuple[MeetingsPublic, int | None]:
+        meetings, total_count = await self.repository.get_user_meetings(
             user_id=user_id,
-            skip=skip,
-            limit=limit,
+            cursor=_decode_cursor(cursor) if cursor else None,
+            limit=limit + 1,
             include_as_participant=include_as_participant,
+            include_count=include_count,
         )
 
         meeting_publics = [
             MeetingPublic.model_validate(meeting) for meeting in meetings
         ]
-        return meeting_publics, total_count
+        return _paginate(meeting_publics, limit), total_count
 
-    def get_past_meetings(
+    async def get_past_meetings(
         self,
         user_id: uuid.UUID,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 100,
         include_as_participant: bool = True,
-    ) -> tuple[list[MeetingPublic], int]:
-        meetings, total_count = self.repository.get_past_meetings(
+        include_count: bool = False,
+    ) -> tuple[MeetingsPublic, int | None]:
+        meetings, total_count = await self.repository.get_past_meetings(
             user_id=user_id,
-            skip=skip,
-            limit=limit,
+            cursor=_decode_cursor(cursor) if cursor else None,
+            limit=limit + 1,
             include_as_participant=include_as_participant,
+            include_count=include_count,
         )
 
         meeting_publics = [
             MeetingPublic.model_validate(meeting) for meeting in meetings
         ]
-        return meeting_publics, total_count
+        return _paginate(meeting_publics, limit), total_count
 
-    def get_user_meeting_requests(
-        self, user_id: uuid.UUID, skip: int = 0, limit: int = 100
-    ) -> list[MeetingPublic]:
-        meetings, _ = self.repository.get_user_meeting_requests(
-            user_id=user_id, skip=skip, limit=limit
+    async def get_user_meeting_requests(
+        self,
+        user_id: uuid.UUID,
+        cursor: str | None = None,
+        limit: int = 100,
+        include_count: bool = False,
+    ) -> tuple[MeetingsPublic, int | None]:
+        meetings, total_count = await self.repository.get_user_meeting_requests(
+            user_id=user_id,
+            cursor=_decode_cursor(cursor) if cursor else None,
+            limit=limit + 1,
+            include_count=include_count,
         )
 
-        return [MeetingPublic.model_validate(meeting) for meeting in meetings]
+        meeting_publics = [
+            MeetingPublic.model_validate(meeting) for meeting in meetings
+        ]
+        page = _paginate(meeting_publics, limit, sort_field="created_at")
+        return page, total_count
 
-    def get_meeting(
+    async def get_meeting(
         self, meeting_id: uuid.UUID, user_id: uuid.UUID
-    ) -> MeetingPublic | None:
-        meeting = self.repository.get_meeting_by_id(meeting_id)
+    ) -> MeetingPublic:
+        meeting = await self.repository.get_meeting_with_details(meeting_id)
         if not meeting:
-            return None
+            raise NotFoundError("Meeting not found or access denied")
 
         return MeetingPublic.model_validate(meeting)
 
-    def add_participant(
+    async def add_participant(
         self,
         meeting_id: uuid.UUID,
         participant_data: ParticipantObject,
         requester_id: uuid.UUID,
     ) -> ParticipantPublic:
-        meeting = self.repository.get_meeting_by_id(meeting_id)
+        meeting = await self.repository.get_meeting_by_id(meeting_id)
         if not meeting:
-            raise ValueError("Meeting not found")
+            raise InvalidRequestError("Meeting not found")
 
         if meeting.owner_id != requester_id:
-            raise ValueError("Only meeting owner can add participants")
+            raise InvalidRequestError("Only meeting owner can add participants")
 
-        db_participant = self.repository.add_participant(meeting_id, participant_data)
+        db_participant = await self.repository.add_participant(
+            meeting_id, participant_data
+        )
         if not db_participant:
-            raise ValueError("Failed to add participant")
+            raise InvalidRequestError("Failed to add participant")
 
         # Check if meeting status should be updated based on participant responses
-        self._update_meeting_status_based_on_participants(meeting_id)
+        await self._update_meeting_status_based_on_participants(meeting_id)
 
         return ParticipantPublic.model_validate(db_participant)
 
-    def update_participant_status(
+    async def add_participants(
+        self,
+        meeting_id: uuid.UUID,
+        participants: list[ParticipantObject],
+        requester_id: uuid.UUID,
+    ) -> list[ParticipantPublic]:
+        meeting = await self.repository.get_meeting_by_id(meeting_id)
+        if not meeting:
+            raise InvalidRequestError("Meeting not found")
+
+        if meeting.owner_id != requester_id:
+            raise InvalidRequestError("Only meeting owner can add participants")
+
+        db_participants = await self.repository.add_participants(
+            meeting_id, participants
+        )
+
+        await self._update_meeting_status_based_on_participants(meeting_id)
+
+        return [ParticipantPublic.model_validate(p) for p in db_participants]
+
+    async def update_participant_status(
         self,
         meeting_id: uuid.UUID,
         user_id: uuid.UUID,
         status: ParticipantStatus,
         requester_id: uuid.UUID,
     ) -> ParticipantPublic:
-        meeting = self.repository.get_meeting_by_id(meeting_id)
+        meeting = await self.repository.get_meeting_by_id(meeting_id)
         if not meeting:
-            raise ValueError("Meeting not found")
+            raise InvalidRequestError("Meeting not found")
 
         if requester_id != user_id and meeting.owner_id != requester_id:
-            raise ValueError("You can only update your own participation status")
+            raise InvalidRequestError("You can only update your own participation status")
 
-        updated_participant = self.repository.update_participant_status(
+        updated_participant = await self.repository.update_participant_status(
             meeting_id, user_id, status
         )
         if not updated_participant:
-            raise ValueError("Participant not found")
+            raise InvalidRequestError("Participant not found")
 
         # Check if meeting status should be updated based on participant responses
-        self._update_meeting_status_based_on_participants(meeting_id)
+        await self._update_meeting_status_based_on_participants(meeting_id)
 
         return ParticipantPublic.model_validate(updated_participant)
 
-    def _update_meeting_status_based_on_participants(
+    async def _update_meeting_status_based_on_participants(
         self, meeting_id: uuid.UUID
     ) -> None:
         """Update meeting status based on all participants' responses."""
-        participants = self.repository.get_meeting_participants(meeting_id)
+        participants = await self.repository.get_meeting_participants(meeting_id)
 
         if not participants:
             return
@@ -197,139 +272,182 @@ class MeetingService:
 
         # Update meeting status if it needs to change
         if new_status:
-            current_meeting = self.repository.get_meeting_by_id(meeting_id)
-            if current_meeting and current_meeting.status != new_status:
-                self.repository.update_meeting(meeting_id, {"status": new_status})
+            await self.repository.set_meeting_status(meeting_id, new_status)
 
-    def update_meeting(
+    async def update_meeting(
         self, meeting_id: uuid.UUID, meeting_data: MeetingObject, user_id: uuid.UUID
     ) -> MeetingPublic:
-        current_meeting = self.repository.get_meeting_by_id(meeting_id)
+        current_meeting = await self.repository.get_meeting_by_id(meeting_id)
         if not current_meeting:
-            raise ValueError("Meeting not found")
+            raise InvalidRequestError("Meeting not found")
 
         if current_meeting.owner_id != user_id:
-            raise ValueError("Only meeting owner can update meeting")
+            raise InvalidRequestError("Only meeting owner can update meeting")
 
         if meeting_data.start_time and meeting_data.start_time <= datetime.now(UTC):
-            raise ValueError("Meeting start time must be in the future")
+            raise InvalidRequestError("Meeting start time must be in the future")
 
         # Resolve meeting type string to type_id if type is provided
         if hasattr(meeting_data, "type") and meeting_data.type:
-            meeting_type = self.repository.get_meeting_type_by_title(meeting_data.type)
-            if not meeting_type:
-                meeting_type_data = MeetingTypeBase(title=meeting_data.type)
-                meeting_type = self.repository.create_meeting_type(meeting_type_data)
+            meeting_type_id = await self._resolve_meeting_type_id(meeting_data.type)
 
             # Convert to dict, remove type, add type_id
             update_data = meeting_data.model_dump()
             update_data.pop("type", None)
-            update_data["type_id"] = meeting_type.id
+            update_data["type_id"] = meeting_type_id
 
             # Create a new MeetingObject-like dict for the repository
             meeting_data_dict = update_data
         else:
             meeting_data_dict = meeting_data.model_dump()
 
-        updated_meeting = self.repository.update_meeting(meeting_id, meeting_data_dict)
+        updated_meeting = await self.repository.update_meeting(
+            meeting_id, meeting_data_dict
+        )
         if not updated_meeting:
-            raise ValueError("Failed to update meeting")
+            raise InvalidRequestError("Failed to update meeting")
 
         return MeetingPublic.model_validate(updated_meeting)
 
-    def delete_meeting(self, meeting_id: uuid.UUID, user_id: uuid.UUID) -> bool:
-        current_meeting = self.repository.get_meeting_by_id(meeting_id)
+    async def delete_meeting(self, meeting_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+        current_meeting = await self.repository.get_meeting_by_id(meeting_id)
         if not current_meeting:
-            raise ValueError("Meeting not found")
+            raise InvalidRequestError("Meeting not found")
 
         if current_meeting.owner_id != user_id:
-            raise ValueError("Only meeting owner can delete meeting")
+            raise InvalidRequestError("Only meeting owner can delete meeting")
 
-        return self.repository.delete_meeting(meeting_id)
+        return await self.repository.delete_meeting(meeting_id)
 
-    def delete_participant_by_id(
+    async def delete_participant_by_id(
         self, participant_id: uuid.UUID, requester_id: uuid.UUID
-    ) -> bool:
-        target_participant = self.repository.get_participant_by_id(participant_id)
+    ) -> uuid.UUID | None:
+        """Remove a participant; returns the meeting they were removed from."""
+        target_participant = await self.repository.get_participant_by_id(participant_id)
         if not target_participant:
-            raise ValueError("Participant not found")
+            raise InvalidRequestError("Participant not found")
 
-        meeting = self.repository.get_meeting_by_id(target_participant.meeting_id)
+        meeting = await self.repository.get_meeting_by_id(target_participant.meeting_id)
         if not meeting:
-            raise ValueError("Meeting not found")
+            raise InvalidRequestError("Meeting not found")
 
         if (
             meeting.owner_id != requester_id
             and requester_id != target_participant.user_id
         ):
-            raise ValueError(
+            raise InvalidRequestError(
                 "You can only remove yourself or be removed by meeting owner"
             )
 
         if target_participant.user_id == meeting.owner_id:
-            raise ValueError("Cannot remove meeting owner from participants")
+            raise InvalidRequestError("Cannot remove meeting owner from participants")
 
-        result = self.repository.delete_participant_by_id(participant_id)
+        result = await self.repository.delete_participant_by_id(participant_id)
 
         if result:
             # Check if meeting status should be updated after participant removal
-            self._update_meeting_status_based_on_participants(
+            await self._update_meeting_status_based_on_participants(
                 target_participant.meeting_id
             )
+            return target_participant.meeting_id
 
-        return result
+        return None
 
     # ============================================================
     # MEETING TYPE METHODS
     # ============================================================
 
-    def create_meeting_type(
+    async def create_meeting_type(
         self, meeting_type_data: MeetingTypeBase
     ) -> MeetingTypePublic:
         """Create a new meeting type."""
-        meeting_type = self.repository.create_meeting_type(meeting_type_data)
+        if await self.repository.get_meeting_type_by_title(meeting_type_data.title):
+            raise InvalidRequestError("Meeting type already exists")
+
+        meeting_type = await self.repository.create_meeting_type(meeting_type_data)
+        _meeting_type_cache.clear()
         return MeetingTypePublic.model_validate(meeting_type)
 
-    def get_meeting_type_by_id(self, meeting_type_id: uuid.UUID) -> MeetingTypePublic:
+    async def get_meeting_type_by_id(
+        self, meeting_type_id: uuid.UUID
+    ) -> MeetingTypePublic:
         """Get a meeting type by ID."""
-        meeting_type = self.repository.get_meeting_type_by_id(meeting_type_id)
+        cached = _meeting_type_cache.get(("id", meeting_type_id))
+        if cached is not None:
+            return cached
+
+        meeting_type = await self.repository.get_meeting_type_by_id(meeting_type_id)
         if not meeting_type:
-            raise ValueError("Meeting type not found")
-        return MeetingTypePublic.model_validate(meeting_type)
+            raise NotFoundError("Meeting type not found")
+        meeting_type_public = MeetingTypePublic.model_validate(meeting_type)
+        _meeting_type_cache.set(("id", meeting_type_id), meeting_type_public)
+        return meeting_type_public
+
+    async def _resolve_meeting_type_id(self, title: str) -> uuid.UUID:
+        """Get the id of the meeting type with this title, creating it if needed."""
+        cached = _meeting_type_cache.get(("title", title))
+        if cached is not None:
+            return cached
+
+        meeting_type = await self.repository.get_meeting_type_by_title(title)
+        if not meeting_type:
+            meeting_type = await self.repository.create_meeting_type(
+                MeetingTypeBase(title=title)
+            )
+            _meeting_type_cache.clear()
+        _meeting_type_cache.set(("title", title), meeting_type.id)
+        return meeting_type.id
 
-    def get_meeting_type_by_title(self, title: str) -> MeetingTypePublic | None:
+    async def get_meeting_type_by_title(self, title: str) -> MeetingTypePublic | None:
         """Get a meeting type by title."""
-        meeting_type = self.repository.get_meeting_type_by_title(title)
+        meeting_type = await self.repository.get_meeting_type_by_title(title)
         if meeting_type:
             return MeetingTypePublic.model_validate(meeting_type)
         return None
 
-    def list_meeting_types(self) -> list[MeetingTypePublic]:
+    async def list_meeting_types(self) -> list[MeetingTypePublic]:
         """List all meeting types."""
-        meeting_types = self.repository.list_meeting_types()
-        return [MeetingTypePublic.model_validate(mt) for mt in meeting_types]
+        cached = _meeting_type_cache.get("list")
+        if cached is not None:
+            return cached
+
+        meeting_types = await self.repository.list_meeting_types()
+        meeting_type_publics = [
+            MeetingTypePublic.model_validate(mt) for mt in meeting_types
+        ]
+        _meeting_type_cache.set("list", meeting_type_publics)
+        return meeting_type_publics
 
-    def update_meeting_type(
+    async def update_meeting_type(
         self, meeting_type_id: uuid.UUID, meeting_type_data: MeetingTypeBase
     ) -> MeetingTypePublic:
         """Update a meeting type."""
-        existing_type = self.repository.get_meeting_type_by_id(meeting_type_id)
+        existing_type = await self.repository.get_meeting_type_by_id(meeting_type_id)
         if not existing_type:
-            raise ValueError("Meeting type not found")
+            raise NotFoundError("Meeting type not found")
+
+        same_title = await self.repository.get_meeting_type_by_title(
+            meeting_type_data.title
+        )
+        if same_title and same_title.id != meeting_type_id:
+            raise InvalidRequestError("Meeting type already exists")
 
-        meeting_type = self.repository.update_meeting_type(
+        meeting_type = await self.repository.update_meeting_type(
             meeting_type_id, meeting_type_data
         )
+        _meeting_type_cache.clear()
         return MeetingTypePublic.model_validate(meeting_type)
 
-    def delete_meeting_type(self, meeting_type_id: uuid.UUID) -> bool:
+    async def delete_meeting_type(self, meeting_type_id: uuid.UUID) -> bool:
         """Delete a meeting type."""
-        existing_type = self.repository.get_meeting_type_by_id(meeting_type_id)
+        existing_type = await self.repository.get_meeting_type_by_id(meeting_type_id)
         if not existing_type:
-            raise ValueError("Meeting type not found")
+            raise NotFoundError("Meeting type not found")
 
         # Check if the meeting type is in use
-        if self.repository.is_meeting_type_in_use(meeting_type_id):
-            raise ValueError("Cannot delete meeting type that is in use")
+        if await self.repository.is_meeting_type_in_use(meeting_type_id):
+            raise InvalidRequestError("Cannot delete meeting type that is in use")
 
-        return self.repository.delete_meeting_type(meeting_type_id)
+        deleted = await self.repository.delete_meeting_type(meeting_type_id)
+        _meeting_type_cache.clear()
+        return deleted
@@ -4,11 +4,13 @@ Handles all user-related database operations, including authentication,
 registration, updates, soft deletion, recovery, and user search.
 """
 
+import asyncio
 import uuid
 from datetime import date, timedelta
 from typing import Any
 
-from sqlmodel import Session, func, or_, select, update
+from sqlmodel import func, or_, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.utils.config import settings
 from app.utils.models import User, UserCreate, UserUpdate
@@ -18,7 +20,7 @@ from app.utils.security import get_password_hash, verify_password
 # from sqlmodel import text
 
 class UserRepository:
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
     # def explain_analyze(self, query) -> None:
@@ -33,105 +35,113 @@ class UserRepository:
     #         print(row[0])
     #     print("--- End Results ---\n")
 
-    def create_user(self, user_create: UserCreate) -> User:
+    async def create_user(self, user_create: UserCreate) -> User:
+        # bcrypt is CPU-bound; hash off the event loop.
+        password_hash = await asyncio.to_thread(
+            get_password_hash, user_create.password
+        )
         db_obj = User.model_validate(
-            user_create,
-            update={"password_hash": get_password_hash(user_create.password)},
+            user_create, update={"password_hash": password_hash}
         )
         self.session.add(db_obj)
-        self.session.commit()
-        self.session.refresh(db_obj)
+        await self.session.commit()
         return db_obj
 
-    def is_email_taken(
+    async def is_email_taken(
         self, email: str, exclude_user_id: uuid.UUID | None = None
     ) -> bool:
         query = select(User).where(User.email == email)
         if exclude_user_id:
             query = query.where(User.id != exclude_user_id)
-        return self.session.exec(query).first() is not None
+        return (await self.session.exec(query)).first() is not None
 
-    def is_account_taken(
+    async def is_account_taken(
         self, account: str, exclude_user_id: uuid.UUID | None = None
     ) -> bool:
         query = select(User).where(User.account == account)
         if exclude_user_id:
             query = query.where(User.id != exclude_user_id)
-        return self.session.exec(query).first() is not None
+        return (await self.session.exec(query)).first() is not None
 
-    def authenticate(self, email: str, password: str) -> User | None:
-        db_user = self.get_user_by_email(email)
+    async def authenticate(self, email: str, password: str) -> User | None:
+        db_user = await self.get_user_by_email(email)
         if not db_user:
             return None
-        if not verify_password(password, db_user.password_hash):
+        if not await asyncio.to_thread(
+            verify_password, password, db_user.password_hash
+        ):
             return None
         return db_user
 
-    def get_user_by_id(self, user_id: uuid.UUID) -> User | None:
-        return self.session.get(User, user_id)
+    async def get_user_by_id(self, user_id: uuid.UUID) -> User | None:
+        return await self.session.get(User, user_id)
 
-    def get_user_by_email(self, email: str) -> User | None:
+    async def get_user_by_email(self, email: str) -> User | None:
         query = select(User).where(User.email == email)
         # self.explain_analyze(query)
-        return self.session.exec(query).first()
+        return (await self.session.exec(query)).first()
 
-    def get_user_by_account(self, account: str) -> User | None:
+    async def get_user_by_account(self, account: str) -> User | None:
         query = select(User).where(User.account == account)
         # self.explain_analyze(query)
-        return self.session.exec(query).first()
+        return (await self.session.exec(query)).first()
 
-    def get_users(self, skip: int = 0, limit: int = 100) -> tuple[list[User], int]:
+    async def get_users(
+        self, skip: int = 0, limit: int = 100
+    ) -> tuple[list[User], int]:
         count_query = select(func.count()).select_from(User)
         # self.explain_analyze(count_query)
-        total_count = self.session.exec(count_query).one()
+        total_count = (await self.session.exec(count_query)).one()
 
         query = select(User).offset(skip).limit(limit)
         # self.explain_analyze(query)
-        users = self.session.exec(query).all()
+        users = (await self.session.exec(query)).all()
 
         return users, total_count
 
-    def update_user(self, db_user: User, user_in: UserUpdate) -> Any:
+    async def update_user(self, db_user: User, user_in: UserUpdate) -> Any:
         user_data = user_in.model_dump(exclude_unset=True)
         extra_data = {}
         if "password" in user_data:
             password = user_data["password"]
-            password_hash = get_password_hash(password)
+            password_hash = await asyncio.to_thread(get_password_hash, password)
             extra_data["password_hash"] = password_hash
         db_user.sqlmodel_update(user_data, update=extra_data)
         self.session.add(db_user)
-        self.session.commit()
-        self.session.refresh(db_user)
+        await self.session.commit()
         return db_user
 
-    def update_user_password(self, db_user: User, password_hash: str) -> User:
+    async def update_user_password(self, db_user: User, password_hash: str) -> User:
         db_user.password_hash = password_hash
         self.session.add(db_user)
-        self.session.commit()
-        self.session.refresh(db_user)
+        await self.session.commit()
         return db_user
 
-    def search_users(
-        self, query: str, skip: int = 0, limit: int = 20
-    ) -> tuple[list[User], int]:
+    async def search_users(
+        self, query: str, cursor: uuid.UUID | None = None, limit: int = 20
+    ) -> tuple[list[User], int | None]:
         search_filter = or_(
             User.name.ilike(f"%{query}%"),
             User.account.ilike(f"%{query}%"),
             User.email.ilike(f"%{query}%"),
         )
 
-        count_query = select(func.count()).select_from(User).where(search_filter)
-        # self.explain_analyze(count_query)
-        total_count = self.session.exec(count_query).one()
+        # Keyset on the primary key: later pages walk the index from the cursor
+        # instead of scanning and discarding every earlier match.
+        user_query = select(User).where(search_filter).order_by(User.id).limit(limit)
+        if cursor is not None:
+            # Counting every match again on each page would undo the keyset.
+            user_query = user_query.where(User.id > cursor)
+            return (await self.session.exec(user_query)).all(), None
 
-        user_query = select(User).where(search_filter).offset(skip).limit(limit)
+        # The first page sees every match, so COUNT(*) OVER () is the total.
+        user_query = user_query.add_columns(func.count().over().label("total_count"))
         # self.explain_analyze(user_query)
-        users = self.session.exec(user_query).all()
-
-        return users, total_count
+        rows = (await self.session.execute(user_query)).all()
+        return [row.User for row in rows], rows[0].total_count if rows else 0
 
-    def soft_delete_user(self, user_id: uuid.UUID) -> bool:
-        user = self.get_user_by_id(user_id)
+    async def soft_delete_user(self, user_id: uuid.UUID) -> bool:
+        user = await self.get_user_by_id(user_id)
         if not user:
             return False
 
@@ -145,12 +155,12 @@ class UserRepository:
             .values(deleted_at=deletion_date, is_active=True)
         )
         # self.explain_analyze(query)
-        self.session.exec(query)
-        self.session.commit()
+        await self.session.exec(query)
+        await self.session.commit()
         return True
 
-    def recover_user(self, user_id: uuid.UUID) -> bool:
-        user = self.get_user_by_id(user_id)
+    async def recover_user(self, user_id: uuid.UUID) -> bool:
+        user = await self.get_user_by_id(user_id)
         if not user or user.deleted_at is None:
             return False
         if date.today() > user.deleted_at:
@@ -162,6 +172,6 @@ class UserRepository:
             .values(deleted_at=None, is_active=True)
         )
         # self.explain_analyze(query)
-        self.session.exec(query)
-        self.session.commit()
+        await self.session.exec(query)
+        await self.session.commit()
         return True
@@ -66,6 +66,11 @@ class Settings(BaseSettings):
     POSTGRES_USER: str = "postgres"
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "raven_db"
+    # Per worker process; keep
+    # workers * (POOL_SIZE + MAX_OVERFLOW) below Postgres max_connections.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_RECYCLE: int = 1800  # seconds
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -1,19 +1,19 @@
 """Dependency Injection and Authentication
 =======================================
 Defines FastAPI dependencies for database sessions, JWT-based user
-authentication, and service/repository injections for user, follow,
-and meeting domains.
+authentication, per-user rate limiting, and service/repository injections
+for user, follow, and meeting domains.
 """
 
-from collections.abc import Generator
-from typing import Annotated
+from collections.abc import AsyncGenerator
+from typing import Annotated, Any
 
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.services.calendar.calendar_repository import CalendarRepository
 from app.services.calendar.calendar_service import CalendarService
@@ -26,23 +26,37 @@ from app.services.user.user_service import UserService
 from app.utils import security
 from app.utils.config import settings
 from app.utils.models import TokenPayload, User
-from app.utils.sqldb import engine
+from app.utils.redisdb import RedisClient, cache_key, get_redis
+from app.utils.sqldb import async_session_maker
 
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/login/access-token"
 )
 
 
-def get_db() -> Generator[Session, None, None]:
-    with Session(engine) as session:
-        yield session
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield a session that commits once, after the route has succeeded.
 
+    Repositories that only flush rely on it, so a request touching several
+    tables (e.g. intervals plus onboarding) pays for a single COMMIT, and a
+    failure anywhere rolls the whole request back. Writes followed by cache
+    invalidation commit themselves first, leaving nothing for this one.
+    """
+    async with async_session_maker() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
 
-SessionDep = Annotated[Session, Depends(get_db)]
+
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_db)]
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
+RedisDep = Annotated[RedisClient, Depends(get_redis)]
 
 
-def get_current_user(session: SessionDep, token: TokenDep) -> User:
+async def get_current_user(session: AsyncSessionDep, token: TokenDep) -> User:
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
@@ -53,7 +67,7 @@ def get_current_user(session: SessionDep, token: TokenDep) -> User:
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    user = session.get(User, token_data.sub)
+    user = await session.get(User, token_data.sub)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -71,7 +85,26 @@ def get_current_active_superuser(current_user: CurrentUser) -> User:
     return current_user
 
 
-def get_user_repository(session: SessionDep) -> UserRepository:
+def rate_limit(scope: str, limit: int, window: int = 60) -> Any:
+    """Allow each user `limit` calls to `scope` per `window` seconds.
+
+    Counters live in Redis; if Redis is unavailable requests are not limited.
+    """
+
+    async def check_rate_limit(current_user: CurrentUser, redis: RedisDep) -> None:
+        hits = await redis.incr(
+            cache_key("ratelimit", scope, current_user.id), ttl=window
+        )
+        if hits is not None and hits > limit:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="TOO_MANY_REQUESTS",
+            )
+
+    return Depends(check_rate_limit)
+
+
+def get_user_repository(session: AsyncSessionDep) -> UserRepository:
     """Get user repository dependency."""
     return UserRepository(session)
 
@@ -87,7 +120,7 @@ UserRepositoryDep = Annotated[UserRepository, Depends(get_user_repository)]
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
 
 
-def get_follow_repository(session: SessionDep) -> FollowRepository:
+def get_follow_repository(session: AsyncSessionDep) -> FollowRepository:
     """Get follow repository dependency."""
     return FollowRepository(session)
 
@@ -103,7 +136,7 @@ FollowRepositoryDep = Annotated[FollowRepository, Depends(get_follow_repository)
 FollowServiceDep = Annotated[FollowService, Depends(get_follow_service)]
 
 
-def get_meeting_repository(session: SessionDep) -> MeetingRepository:
+def get_meeting_repository(session: AsyncSessionDep) -> MeetingRepository:
     """Get meeting repository dependency."""
     return MeetingRepository(session)
 
@@ -119,7 +152,7 @@ MeetingRepositoryDep = Annotated[MeetingRepository, Depends(get_meeting_reposito
 MeetingServiceDep = Annotated[MeetingService, Depends(get_meeting_service)]
 
 
-def get_calendar_repository(session: SessionDep) -> CalendarRepository:
+def get_calendar_repository(session: AsyncSessionDep) -> CalendarRepository:
     """Get calendar repository dependency."""
     return CalendarRepository(session)
 
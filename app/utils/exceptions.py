@@ -2,6 +2,7 @@
 ========================
 Standardizes API error responses by mapping validation errors
 to uniform error codes and formatting HTTP exceptions for consistent JSON output.
+Service InvalidRequestErrors become 400 responses (404 for NotFoundError).
 """
 
 from fastapi import HTTPException, Request, status
@@ -95,16 +96,42 @@ async def validation_exception_handler(
     )
 
 
+class InvalidRequestError(Exception):
+    """Service error for a request that breaks a business rule; rendered as 400."""
+
+
+class NotFoundError(InvalidRequestError):
+    """Service error for a missing resource; rendered as 404 instead of 400."""
+
+
+def get_error_code(detail: str) -> str:
+    """Turn a message like "Meeting not found" into MEETING_NOT_FOUND."""
+    detail = detail.strip().rstrip(".!?,")
+    return detail.replace(" ", "_").upper()
+
+
 async def http_exception_handler(request: Request, exc: HTTPException):
     if isinstance(exc.detail, dict):
         return JSONResponse(status_code=exc.status_code, content={"errors": exc.detail})
 
-    detail = str(exc.detail).strip().rstrip(".!?,")
-    error_code = detail.replace(" ", "_").upper()
+    error_code = get_error_code(str(exc.detail))
 
     return JSONResponse(status_code=exc.status_code, content={"errors": error_code})
 
 
+async def invalid_request_handler(request: Request, exc: InvalidRequestError):
+    """Services signal rule violations with InvalidRequestError; map them here."""
+    status_code = (
+        status.HTTP_404_NOT_FOUND
+        if isinstance(exc, NotFoundError)
+        else status.HTTP_400_BAD_REQUEST
+    )
+    return JSONResponse(
+        status_code=status_code, content={"errors": get_error_code(str(exc))}
+    )
+
+
 request_validation_error = validation_exception_handler
 validation_error = validation_exception_handler
 http_validation_error = http_exception_handler
+invalid_request_error = invalid_request_handler
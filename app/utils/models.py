@@ -11,6 +11,7 @@ from typing import Annotated
 
 import phonenumbers
 from pydantic import BeforeValidator, EmailStr
+from sqlalchemy import Index, UniqueConstraint, desc
 from sqlmodel import Field, Relationship, SQLModel
 
 # ============================================================
@@ -142,6 +143,17 @@ class UserBase(SQLModel):
 class User(UserBase, table=True):
     """User table model."""
 
+    # Trigram indexes let search's ILIKE '%q%' filters use an index (pg_trgm).
+    __table_args__ = tuple(
+        Index(
+            f"ix_user_{column}_trgm",
+            column,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+        for column in ("name", "account", "email")
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     password_hash: str
     avatar_photo: Photo | None = Relationship(back_populates=None)
@@ -193,7 +205,9 @@ class UsersPublic(SQLModel):
     """Schema for paginated user list."""
 
     data: list[UserPublic]
-    count: int
+    # Total matches; user search only reports it on the first page.
+    count: int | None = None
+    next_cursor: uuid.UUID | None = None
 
 
 # ============================================================
@@ -214,6 +228,15 @@ class FollowBase(SQLModel):
 class Follow(FollowBase, table=True):
     """Follow table model for user relationships."""
 
+    # The unique pair serves follower-side lookups; the reverse index serves
+    # followers lists, follower counts and the inverse status check.
+    __table_args__ = (
+        UniqueConstraint(
+            "follower_id", "following_id", name="uq_follow_follower_id_following_id"
+        ),
+        Index("ix_follow_following_follower", "following_id", "follower_id"),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
 
 
@@ -325,11 +348,23 @@ class MeetingBase(SQLModel):
 class Meeting(MeetingBase, table=True):
     """Meeting table model."""
 
+    # Backs keyset pagination of a user's meetings by (start_time, id).
+    __table_args__ = (
+        Index(
+            "ix_meeting_owner_id_start_time_id",
+            "owner_id",
+            desc("start_time"),
+            desc("id"),
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
 
     # Relationships
-    participants: list["Participant"] = Relationship(back_populates="meeting")
-    meeting_type: MeetingType = Relationship()
+    participants: list["Participant"] = Relationship(
+        back_populates="meeting", sa_relationship_kwargs={"lazy": "raise"}
+    )
+    meeting_type: MeetingType = Relationship(sa_relationship_kwargs={"lazy": "raise"})
     owner: User = Relationship(
         sa_relationship_kwargs={"foreign_keys": "[Meeting.owner_id]"}
     )
@@ -359,7 +394,7 @@ class MeetingCreate(SQLModel):
     """Schema for creating a new meeting with participants."""
 
     meeting: MeetingObject
-    participants: list["ParticipantObject"] = []
+    participants: list["ParticipantObject"] = Field(default=[], max_length=200)
 
 
 class MeetingPublic(MeetingBase):
@@ -370,6 +405,14 @@ class MeetingPublic(MeetingBase):
     participants: list["ParticipantPublic"] = []
 
 
+class MeetingsPublic(SQLModel):
+    """Schema for a cursor-paginated meeting list."""
+
+    data: list[MeetingPublic]
+    has_more: bool = False
+    next_cursor: str | None = None
+
+
 # ============================================================
 # PARTICIPANT MODULE
 # ============================================================
@@ -393,7 +436,7 @@ class Participant(ParticipantBase, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
 
     meeting: Meeting = Relationship(back_populates="participants")
-    user: User = Relationship()
+    user: User = Relationship(sa_relationship_kwargs={"lazy": "raise"})
 
 
 # Participant Schemas
@@ -446,7 +489,7 @@ class RefreshTokenRequest(SQLModel):
 class TokenPayload(SQLModel):
     """Contents of JWT token."""
 
-    sub: str | None = None
+    sub: uuid.UUID | None = None
 
 
 class NewPassword(SQLModel):
@@ -489,6 +532,9 @@ class GoogleCalendarAuth(SQLModel, table=True):
 class Calendar(SQLModel, table=True):
     """User calendar availability table."""
 
+    # Backs the per-day interval replace and the grouped availability read.
+    __table_args__ = (Index("ix_calendar_user_day", "user_id", "day_of_week"),)
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     user_id: uuid.UUID = Field(foreign_key="user.id")
     day_of_week: int = Field(ge=0, le=6)  # 0=Monday, 6=Sunday
@@ -497,13 +543,16 @@ class Calendar(SQLModel, table=True):
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
-    user: "User" = Relationship(back_populates=None)
+    user: "User" = Relationship(
+        back_populates=None, sa_relationship_kwargs={"lazy": "raise"}
+    )
 
 
 class AvailabilityException(SQLModel, table=True):
     """Exceptions to regular calendar availability with recurrence support."""
     
     __tablename__ = "availability_exception"
+    __table_args__ = (Index("ix_avail_exc_user", "user_id"),)
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     user_id: uuid.UUID = Field(foreign_key="user.id")
@@ -516,7 +565,9 @@ class AvailabilityException(SQLModel, table=True):
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
-    user: "User" = Relationship(back_populates=None)
+    user: "User" = Relationship(
+        back_populates=None, sa_relationship_kwargs={"lazy": "raise"}
+    )
 
 
 class Onboarding(SQLModel, table=True):
@@ -536,6 +587,7 @@ class CalendarEvent(SQLModel, table=True):
     """Calendar events synced from Google Calendar."""
     
     __tablename__ = "google_calendar_event"
+    __table_args__ = (Index("ix_calendar_event_user", "user_id"),)
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     user_id: uuid.UUID = Field(foreign_key="user.id")
@@ -547,7 +599,9 @@ class CalendarEvent(SQLModel, table=True):
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
-    user: "User" = Relationship(back_populates=None)
+    user: "User" = Relationship(
+        back_populates=None, sa_relationship_kwargs={"lazy": "raise"}
+    )
 
 
 class CalendarAuthResponse(SQLModel):
@@ -0,0 +1,48 @@
+"""Query Parameter Models.
+
+======================
+Shared query-string models for list endpoints, declared once so validation
+and the generated OpenAPI stay consistent across routes.
+
+Usage:
+    params: Annotated[PaginationParams, Query()]
+"""
+
+import uuid
+
+from pydantic import BaseModel, Field
+
+
+class PaginationParams(BaseModel):
+    """Offset pagination for follow lists."""
+
+    skip: int = Field(0, ge=0)
+    limit: int = Field(20, ge=1, le=100)
+
+
+class UserSearchParams(BaseModel):
+    """Keyset pagination for user search, ordered by user id."""
+
+    q: str = Field(..., min_length=2)
+    cursor: uuid.UUID | None = Field(
+        None, description="next_cursor from the previous page; omit for the first"
+    )
+    limit: int = Field(20, ge=1, le=100)
+
+
+class CursorParams(BaseModel):
+    """Keyset pagination for meeting lists."""
+
+    cursor: str | None = Field(
+        None, description="next_cursor from the previous page; omit for the first"
+    )
+    limit: int = Field(100, ge=1, le=1000)
+    include_count: bool = Field(
+        False, description="Return the total in the X-Total-Count header"
+    )
+
+
+class MeetingListParams(CursorParams):
+    include_as_participant: bool = Field(
+        True, description="Include meetings where user is a participant"
+    )
@@ -1,8 +1,8 @@
 """Redis Client Wrapper
 ====================
 Provides an asynchronous Redis client with common caching operations,
-including connect, disconnect, get, set, delete, exists, and flushdb,
-plus utility functions for cache key generation.
+including connect, disconnect, get, set, delete, delete_many, incr, exists,
+and flushdb, plus utility functions for cache key generation.
 """
 
 import json
@@ -77,6 +77,37 @@ class RedisClient:
         except Exception:
             return False
 
+    async def delete_many(self, *keys: str) -> bool:
+        """Delete several keys from Redis with one variadic DEL."""
+        if not self.redis or not keys:
+            return False
+
+        try:
+            await self.redis.delete(*keys)
+        except Exception:
+            return False
+        else:
+            return True
+
+    async def incr(self, key: str, ttl: int) -> int | None:
+        """Increment a counter, starting its TTL when it is created.
+
+        INCR and EXPIRE NX go out in one MULTI, so a counter can never be left
+        without a TTL; NX keeps an existing window from being extended.
+        """
+        if not self.redis:
+            return None
+
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.incr(key)
+                pipe.expire(key, ttl, nx=True)
+                count, _ = await pipe.execute()
+        except Exception:
+            return None
+        else:
+            return count
+
     async def exists(self, key: str) -> bool:
         """Check if key exists in Redis."""
         if not self.redis:
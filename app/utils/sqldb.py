@@ -1,21 +1,36 @@
 """Database Initialization
 =======================
-Creates the database engine and initializes the first superuser
-in the database if not already present.
+Creates the async database engine and initializes the first superuser in
+the database if not already present.
 """
 
-from sqlmodel import Session, create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.services.user.user_repository import UserRepository
 from app.utils.config import settings
 from app.utils.models import UserCreate
 
-engine = create_engine(str(settings.SYNC_DATABASE_URI))
+POOL_OPTIONS = {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_pre_ping": True,
+}
 
+async_engine = create_async_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI), **POOL_OPTIONS
+)
 
-def init_db(session: Session) -> None:
+# expire_on_commit=False: attributes cannot be lazily reloaded under asyncio.
+async_session_maker = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False
+)
+
+
+async def init_db(session: AsyncSession) -> None:
     repository = UserRepository(session)
-    user = repository.get_user_by_email(settings.FIRST_SUPERUSER)
+    user = await repository.get_user_by_email(settings.FIRST_SUPERUSER)
     if not user:
         user_in = UserCreate(
             email=settings.FIRST_SUPERUSER,
@@ -24,4 +39,4 @@ def init_db(session: Session) -> None:
             name=settings.FIRST_SUPERUSER_NAME,
             is_superuser=True,
         )
-        user = repository.create_user(user_in)
+        user = await repository.create_user(user_in)
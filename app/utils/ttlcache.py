@@ -0,0 +1,40 @@
+"""In-Process TTL Cache.
+
+====================
+A small per-process cache for values that are cheap to serve slightly stale,
+such as reference data. Each worker has its own copy,
+so writes elsewhere are only seen once local entries expire.
+"""
+
+import time
+from typing import Any
+
+
+class TTLCache:
+    """Minimal per-process cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, ttl: float, maxsize: int | None = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[Any, tuple[float, Any]] = {}
+
+    def get(self, key: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, key: Any, value: Any) -> None:
+        if self.maxsize is not None and len(self._entries) >= self.maxsize:
+            self._evict()
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the oldest ones if still at capacity."""
+        now = time.monotonic()
+        self._entries = {k: v for k, v in self._entries.items() if v[0] >= now}
+        while len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
@@ -0,0 +1,138 @@
+import pytest
+from sqlalchemy import event
+from sqlmodel import select
+
+from app.services.calendar.calendar_repository import CalendarRepository
+from app.utils.models import Calendar
+
+MONDAY, TUESDAY = 0, 1
+
+
+@pytest.fixture
+def repository(session) -> CalendarRepository:
+    return CalendarRepository(session)
+
+
+@pytest.fixture
+def writes(session) -> list[str]:
+    """INSERT/UPDATE/DELETE statements sent on the session's engine."""
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if statement.lstrip().split(" ", 1)[0] in {"INSERT", "UPDATE", "DELETE"}:
+            statements.append(statement)
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def _intervals(*pairs: tuple[str, str]) -> list[dict[str, str]]:
+    return [{"start_time": start, "end_time": end} for start, end in pairs]
+
+
+async def _stored(session, user, day=MONDAY) -> dict[tuple[str, str], object]:
+    rows = (
+        await session.exec(
+            select(Calendar).where(
+                Calendar.user_id == user.id, Calendar.day_of_week == day
+            )
+        )
+    ).all()
+    return {(row.start_time, row.end_time): row.id for row in rows}
+
+
+async def test_first_save_inserts_every_interval(repository, session, users):
+    saved = await repository.create_intervals_for_day(
+        users[0].id, MONDAY, _intervals(("09:00", "12:00"), ("13:00", "17:00"))
+    )
+    await session.commit()
+
+    assert len(saved) == 2
+    assert set(await _stored(session, users[0])) == {
+        ("09:00", "12:00"),
+        ("13:00", "17:00"),
+    }
+
+
+async def test_unchanged_save_issues_no_writes(repository, session, users, writes):
+    intervals = _intervals(("09:00", "12:00"), ("13:00", "17:00"))
+    await repository.create_intervals_for_day(users[0].id, MONDAY, intervals)
+    await session.commit()
+    before = await _stored(session, users[0])
+    writes.clear()
+
+    saved = await repository.create_intervals_for_day(users[0].id, MONDAY, intervals)
+    await session.commit()
+
+    assert writes == []
+    assert {row.id for row in saved} == set(before.values())
+    assert await _stored(session, users[0]) == before
+
+
+async def test_changed_save_only_replaces_the_difference(
+    repository, session, users, writes
+):
+    await repository.create_intervals_for_day(
+        users[0].id, MONDAY, _intervals(("09:00", "12:00"), ("13:00", "17:00"))
+    )
+    await session.commit()
+    before = await _stored(session, users[0])
+    writes.clear()
+
+    await repository.create_intervals_for_day(
+        users[0].id, MONDAY, _intervals(("09:00", "12:00"), ("18:00", "20:00"))
+    )
+    await session.commit()
+
+    after = await _stored(session, users[0])
+    assert set(after) == {("09:00", "12:00"), ("18:00", "20:00")}
+    assert after[("09:00", "12:00")] == before[("09:00", "12:00")]
+    assert [statement.split(" ", 1)[0] for statement in writes] == [
+        "DELETE",
+        "INSERT",
+    ]
+
+
+async def test_save_drops_duplicate_rows_and_requested_duplicates(
+    repository, session, users
+):
+    session.add_all(
+        Calendar(
+            user_id=users[0].id,
+            day_of_week=MONDAY,
+            start_time="09:00",
+            end_time="12:00",
+        )
+        for _ in range(2)
+    )
+    await session.commit()
+
+    saved = await repository.create_intervals_for_day(
+        users[0].id, MONDAY, _intervals(("09:00", "12:00"), ("09:00", "12:00"))
+    )
+    await session.commit()
+
+    assert len(saved) == 1
+    assert list(await _stored(session, users[0])) == [("09:00", "12:00")]
+
+
+async def test_empty_save_clears_the_day_only(repository, session, users):
+    await repository.create_intervals_for_day(
+        users[0].id, MONDAY, _intervals(("09:00", "12:00"))
+    )
+    await repository.create_intervals_for_day(
+        users[0].id, TUESDAY, _intervals(("09:00", "12:00"))
+    )
+    await repository.create_intervals_for_day(
+        users[1].id, MONDAY, _intervals(("09:00", "12:00"))
+    )
+    await session.commit()
+
+    assert await repository.create_intervals_for_day(users[0].id, MONDAY, []) == []
+    await session.commit()
+
+    assert await _stored(session, users[0]) == {}
+    assert list(await _stored(session, users[0], TUESDAY)) == [("09:00", "12:00")]
+    assert list(await _stored(session, users[1])) == [("09:00", "12:00")]
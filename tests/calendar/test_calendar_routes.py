@@ -0,0 +1,27 @@
+async def test_saving_intervals_replaces_the_day_and_marks_onboarding(
+    client, users, auth_headers
+):
+    headers = auth_headers(users[0])
+
+    for intervals in (
+        [{"start_time": "09:00", "end_time": "12:00"}],
+        [
+            {"start_time": "09:00", "end_time": "12:00"},
+            {"start_time": "13:00", "end_time": "17:00"},
+        ],
+    ):
+        response = await client.post(
+            "/calendar/intervals",
+            json={"day_of_week": 0, "intervals": intervals},
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+    entries = (await client.get("/calendar/entries/list", headers=headers)).json()
+    assert entries["count"] == 2
+    assert sorted(
+        (entry["start_time"], entry["end_time"]) for entry in entries["entries"]
+    ) == [("09:00", "12:00"), ("13:00", "17:00")]
+
+    onboarding = await client.get("/calendar/onboarding/check", headers=headers)
+    assert onboarding.json()["calendar"] is True
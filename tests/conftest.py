@@ -0,0 +1,167 @@
+"""Shared test fixtures.
+
+The app runs against a throwaway SQLite file (separate connections, so only
+committed rows are visible across sessions) and an in-memory Redis stand-in
+behind the real RedisClient wrapper.
+"""
+
+from collections.abc import AsyncIterator
+from datetime import timedelta
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.main import create_app
+from app.services.meeting import meeting_service
+from app.utils import delegate, security
+from app.utils.config import settings
+from app.utils.models import User
+from app.utils.redisdb import RedisClient, get_redis
+
+
+class FakePipeline:
+    """Queues commands and runs them in order on execute()."""
+
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list:
+        self.redis.executed_pipelines.append([name for name, _, _ in self.commands])
+        return [
+            await getattr(self.redis, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+
+
+class FakeRedis:
+    """The subset of redis.asyncio.Redis that RedisClient uses, in memory."""
+
+    def __init__(self):
+        self.store: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+        self.executed_pipelines: list[list[str]] = []
+
+    async def ping(self) -> bool:
+        return True
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value) -> bool:
+        self.store[key] = value
+        self.ttls[key] = ttl
+        return True
+
+    async def delete(self, *keys) -> int:
+        removed = 0
+        for key in keys:
+            removed += self.store.pop(key, None) is not None
+            self.ttls.pop(key, None)
+        return removed
+
+    async def incr(self, key) -> int:
+        value = int(self.store.get(key, 0)) + 1
+        self.store[key] = str(value)
+        return value
+
+    async def expire(self, key, ttl, nx=False) -> bool:
+        if key not in self.store or (nx and key in self.ttls):
+            return False
+        self.ttls[key] = ttl
+        return True
+
+    async def exists(self, *keys) -> int:
+        return sum(key in self.store for key in keys)
+
+    async def flushdb(self) -> bool:
+        self.store.clear()
+        self.ttls.clear()
+        return True
+
+    def pipeline(self, **_options) -> FakePipeline:
+        return FakePipeline(self)
+
+
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    """Module-level caches would otherwise carry ids across test databases."""
+    yield
+    meeting_service._meeting_type_cache.clear()
+
+
+@pytest.fixture
+async def session_maker(tmp_path) -> AsyncIterator[async_sessionmaker]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(session_maker) -> AsyncIterator[AsyncSession]:
+    async with session_maker() as session:
+        yield session
+
+
+@pytest.fixture
+def redis() -> RedisClient:
+    client = RedisClient()
+    client.redis = FakeRedis()
+    return client
+
+
+@pytest.fixture
+async def client(session_maker, redis, monkeypatch) -> AsyncIterator[AsyncClient]:
+    monkeypatch.setattr(delegate, "async_session_maker", session_maker)
+    app = create_app()
+    app.dependency_overrides[get_redis] = lambda: redis
+    transport = ASGITransport(app=app)
+    async with AsyncClient(
+        transport=transport, base_url=f"http://test{settings.API_V1_STR}"
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+async def users(session) -> list[User]:
+    users = [
+        User(
+            name=f"Test User {i}",
+            email=f"user{i}@example.com",
+            account=f"testuser{i}",
+            password_hash="not-a-real-hash",
+        )
+        for i in range(4)
+    ]
+    session.add_all(users)
+    await session.commit()
+    return users
+
+
+@pytest.fixture
+def auth_headers():
+    """Build a bearer header for a user, as issued by the login route."""
+
+    def build(user: User) -> dict[str, str]:
+        token = security.create_access_token(user.id, timedelta(minutes=5))
+        return {"Authorization": f"Bearer {token}"}
+
+    return build
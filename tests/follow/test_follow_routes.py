@@ -0,0 +1,138 @@
+from sqlmodel import select
+
+from app.utils.models import Follow
+from app.utils.redisdb import cache_key
+
+
+def _record_commit_state_on_invalidate(redis, session_maker, follower, following):
+    """Wrap delete_many to note whether the follow row was committed by then."""
+    seen = []
+    delete_many = redis.delete_many
+
+    async def checking_delete_many(*keys):
+        async with session_maker() as other:
+            row = (
+                await other.exec(
+                    select(Follow).where(
+                        Follow.follower_id == follower.id,
+                        Follow.following_id == following.id,
+                    )
+                )
+            ).first()
+        seen.append(row is not None)
+        return await delete_many(*keys)
+
+    redis.delete_many = checking_delete_many
+    return seen
+
+
+async def test_follow_commits_before_invalidating_cache(
+    client, redis, session_maker, users, auth_headers
+):
+    me, other = users[0], users[1]
+    seen = _record_commit_state_on_invalidate(redis, session_maker, me, other)
+
+    response = await client.post(f"/follow/{other.id}/start", headers=auth_headers(me))
+
+    assert response.status_code == 200
+    assert seen == [True]
+
+
+async def test_unfollow_commits_before_invalidating_cache(
+    client, redis, session_maker, users, auth_headers
+):
+    me, other = users[0], users[1]
+    await client.post(f"/follow/{other.id}/start", headers=auth_headers(me))
+    seen = _record_commit_state_on_invalidate(redis, session_maker, me, other)
+
+    response = await client.post(f"/follow/{other.id}/stop", headers=auth_headers(me))
+
+    assert response.status_code == 200
+    assert seen == [False]
+
+
+async def test_follow_invalidates_cached_status_and_counts(
+    client, redis, users, auth_headers
+):
+    me, other = users[0], users[1]
+    status_key = cache_key("follow:status", me.id, other.id)
+    counts_key = cache_key("follow:counts", other.id)
+
+    response = await client.get(f"/follow/status/{other.id}", headers=auth_headers(me))
+    assert response.json()["is_following"] is False
+    await client.get(f"/follow/{other.id}/stats/view", headers=auth_headers(me))
+    assert status_key in redis.redis.store
+    assert counts_key in redis.redis.store
+
+    await client.post(f"/follow/{other.id}/start", headers=auth_headers(me))
+
+    assert status_key not in redis.redis.store
+    assert counts_key not in redis.redis.store
+    response = await client.get(f"/follow/status/{other.id}", headers=auth_headers(me))
+    assert response.json()["is_following"] is True
+    response = await client.get(
+        f"/follow/{other.id}/stats/view", headers=auth_headers(me)
+    )
+    assert response.json()["followers_count"] == 1
+
+
+async def test_duplicate_follow_is_rejected_without_a_second_row(
+    client, session_maker, users, auth_headers
+):
+    me, other = users[0], users[1]
+
+    first = await client.post(f"/follow/{other.id}/start", headers=auth_headers(me))
+    second = await client.post(f"/follow/{other.id}/start", headers=auth_headers(me))
+
+    assert first.status_code == 200
+    assert second.status_code == 400
+    assert second.json() == {"errors": "ALREADY_FOLLOWING_THIS_USER"}
+    async with session_maker() as other_session:
+        rows = (
+            await other_session.exec(
+                select(Follow).where(
+                    Follow.follower_id == me.id, Follow.following_id == other.id
+                )
+            )
+        ).all()
+    assert len(rows) == 1
+
+
+async def test_follow_yourself_is_rejected(client, users, auth_headers):
+    me = users[0]
+
+    response = await client.post(f"/follow/{me.id}/start", headers=auth_headers(me))
+
+    assert response.status_code == 400
+    assert response.json() == {"errors": "CANNOT_FOLLOW_YOURSELF"}
+
+
+async def test_unfollow_without_follow_is_not_found(client, users, auth_headers):
+    me, other = users[0], users[1]
+
+    response = await client.post(f"/follow/{other.id}/stop", headers=auth_headers(me))
+
+    assert response.status_code == 404
+
+
+async def test_mutual_follow_status_and_lists(client, users, auth_headers):
+    me, other = users[0], users[1]
+    await client.post(f"/follow/{other.id}/start", headers=auth_headers(me))
+    await client.post(f"/follow/{me.id}/start", headers=auth_headers(other))
+
+    status = await client.get(f"/follow/status/{other.id}", headers=auth_headers(me))
+    following = await client.get("/follow/me/following/list", headers=auth_headers(me))
+    followers = await client.get("/follow/me/followers/list", headers=auth_headers(me))
+
+    assert status.json() == {
+        "is_following": True,
+        "is_followed_by": True,
+        "is_mutual": True,
+    }
+    assert [row["user"]["account"] for row in following.json()["data"]] == [
+        other.account
+    ]
+    assert [row["user"]["account"] for row in followers.json()["data"]] == [
+        other.account
+    ]
+    assert "password_hash" not in following.json()["data"][0]["user"]
@@ -0,0 +1,10 @@
+async def test_liveness(client):
+    response = await client.get("/health/liveness")
+
+    assert response.status_code == 204
+
+
+async def test_readiness_checks_the_database(client):
+    response = await client.get("/health/readiness")
+
+    assert response.status_code == 204
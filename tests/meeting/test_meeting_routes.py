@@ -0,0 +1,241 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.utils.config import settings
+
+
+@pytest.fixture
+def create_meeting(client, auth_headers):
+    """POST /meeting/create as owner, inviting the given users."""
+
+    async def create(owner, invitees, days_ahead: int = 1, title="Planning sync"):
+        start_time = datetime.now(UTC) + timedelta(days=days_ahead)
+        response = await client.post(
+            "/meeting/create",
+            json={
+                "meeting": {
+                    "title": title,
+                    "type": "standup meeting",
+                    "start_time": start_time.isoformat(),
+                    "location": "Room 101",
+                },
+                "participants": [{"user_id": str(user.id)} for user in invitees],
+            },
+            headers=auth_headers(owner),
+        )
+        assert response.status_code == 201, response.text
+        return response.json()
+
+    return create
+
+
+async def test_index_pages_with_next_cursor(
+    client, users, auth_headers, create_meeting
+):
+    owner, guest = users[0], users[1]
+    created = [
+        await create_meeting(owner, [guest], days_ahead=days) for days in (1, 2, 3)
+    ]
+
+    first = await client.get(
+        "/meeting/index",
+        params={"limit": 2, "include_count": True},
+        headers=auth_headers(owner),
+    )
+    assert first.status_code == 200
+    assert first.headers["X-Total-Count"] == "3"
+    body = first.json()
+    assert [m["id"] for m in body["data"]] == [m["id"] for m in created[:2]]
+    assert body["has_more"] is True
+    assert body["next_cursor"]
+
+    second = await client.get(
+        "/meeting/index",
+        params={"limit": 2, "cursor": body["next_cursor"]},
+        headers=auth_headers(owner),
+    )
+    body = second.json()
+    assert [m["id"] for m in body["data"]] == [created[2]["id"]]
+    assert body["has_more"] is False
+    assert body["next_cursor"] is None
+
+
+async def test_index_lists_only_accepted_invitations(
+    client, users, auth_headers, create_meeting
+):
+    owner, guest = users[0], users[1]
+    pending = await create_meeting(owner, [guest], days_ahead=1)
+    accepted = await create_meeting(owner, [guest], days_ahead=2)
+    await client.post(
+        f"/meeting/{accepted['id']}/status/accept", headers=auth_headers(guest)
+    )
+
+    response = await client.get("/meeting/index", headers=auth_headers(guest))
+    assert [m["id"] for m in response.json()["data"]] == [accepted["id"]]
+
+    response = await client.get("/meeting/requests", headers=auth_headers(guest))
+    assert [m["id"] for m in response.json()["data"]] == [pending["id"]]
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "bm8tc2VwYXJhdG9y", "%%%"])
+async def test_malformed_cursor_is_rejected(client, users, auth_headers, cursor):
+    response = await client.get(
+        "/meeting/index", params={"cursor": cursor}, headers=auth_headers(users[0])
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"errors": "INVALID_CURSOR"}
+
+
+@pytest.mark.parametrize(
+    ("action", "expected"), [("accept", "accepted"), ("decline", "declined")]
+)
+async def test_respond_to_invitation(
+    client, users, auth_headers, create_meeting, action, expected
+):
+    owner, guest = users[0], users[1]
+    meeting = await create_meeting(owner, [guest])
+
+    response = await client.post(
+        f"/meeting/{meeting['id']}/status/{action}", headers=auth_headers(guest)
+    )
+
+    assert response.status_code == 200
+    detail = await client.get(f"/meeting/{meeting['id']}", headers=auth_headers(guest))
+    statuses = {p["user_id"]: p["status"] for p in detail.json()["participants"]}
+    assert statuses[str(guest.id)] == expected
+
+
+async def test_unknown_action_is_rejected(client, users, auth_headers, create_meeting):
+    meeting = await create_meeting(users[0], [users[1]])
+
+    response = await client.post(
+        f"/meeting/{meeting['id']}/status/maybe", headers=auth_headers(users[1])
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    ("old", "expected"), [("approve", "accepted"), ("decline", "declined")]
+)
+async def test_deprecated_routes_still_respond(
+    client, users, auth_headers, create_meeting, old, expected
+):
+    owner, guest = users[0], users[1]
+    meeting = await create_meeting(owner, [guest])
+
+    response = await client.post(
+        f"/meeting/{meeting['id']}/{old}", headers=auth_headers(guest)
+    )
+
+    assert response.status_code == 200
+    detail = await client.get(f"/meeting/{meeting['id']}", headers=auth_headers(guest))
+    statuses = {p["user_id"]: p["status"] for p in detail.json()["participants"]}
+    assert statuses[str(guest.id)] == expected
+
+    paths = (await client.get("/openapi.json")).json()["paths"]
+    operation = paths[f"{settings.API_V1_STR}/meeting/{{meeting_id}}/{old}"]["post"]
+    assert operation["deprecated"] is True
+
+
+async def test_meeting_etag_revalidation(client, users, auth_headers, create_meeting):
+    owner, guest = users[0], users[1]
+    meeting = await create_meeting(owner, [guest])
+    url = f"/meeting/{meeting['id']}"
+
+    first = await client.get(url, headers=auth_headers(owner))
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    unchanged = await client.get(
+        url, headers={**auth_headers(owner), "If-None-Match": etag}
+    )
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert unchanged.headers["ETag"] == etag
+
+    await client.post(
+        f"/meeting/{meeting['id']}/status/accept", headers=auth_headers(guest)
+    )
+    changed = await client.get(
+        url, headers={**auth_headers(owner), "If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+async def test_missing_meeting_is_not_found(client, users, auth_headers):
+    response = await client.get(
+        f"/meeting/{uuid.uuid4()}", headers=auth_headers(users[0])
+    )
+
+    assert response.status_code == 404
+    assert response.json() == {"errors": "MEETING_NOT_FOUND_OR_ACCESS_DENIED"}
+
+
+async def test_add_participants_in_bulk(client, users, auth_headers, create_meeting):
+    owner = users[0]
+    meeting = await create_meeting(owner, [users[1]])
+
+    response = await client.post(
+        f"/meeting/{meeting['id']}/participants/bulk",
+        json=[{"user_id": str(users[2].id)}, {"user_id": str(users[3].id)}],
+        headers=auth_headers(owner),
+    )
+
+    assert response.status_code == 200
+    assert {p["user"]["account"] for p in response.json()} == {
+        users[2].account,
+        users[3].account,
+    }
+    detail = await client.get(f"/meeting/{meeting['id']}", headers=auth_headers(owner))
+    assert len(detail.json()["participants"]) == 4
+
+
+@pytest.mark.parametrize(
+    ("participants", "error"),
+    [
+        (lambda users: [users[1]], "USER_IS_ALREADY_A_PARTICIPANT_IN_THIS_MEETING"),
+        (lambda users: [users[2], users[2]], "DUPLICATE_PARTICIPANTS_IN_REQUEST"),
+        (lambda _: [None], "USER_DOES_NOT_EXIST"),
+    ],
+)
+async def test_add_participants_in_bulk_rejects_invalid_batches(
+    client, users, auth_headers, create_meeting, participants, error
+):
+    owner = users[0]
+    meeting = await create_meeting(owner, [users[1]])
+    batch = [
+        {"user_id": str(user.id if user else uuid.uuid4())}
+        for user in participants(users)
+    ]
+
+    response = await client.post(
+        f"/meeting/{meeting['id']}/participants/bulk",
+        json=batch,
+        headers=auth_headers(owner),
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"errors": error}
+    detail = await client.get(f"/meeting/{meeting['id']}", headers=auth_headers(owner))
+    assert len(detail.json()["participants"]) == 2
+
+
+async def test_only_owner_adds_participants_in_bulk(
+    client, users, auth_headers, create_meeting
+):
+    meeting = await create_meeting(users[0], [users[1]])
+
+    response = await client.post(
+        f"/meeting/{meeting['id']}/participants/bulk",
+        json=[{"user_id": str(users[2].id)}],
+        headers=auth_headers(users[1]),
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"errors": "ONLY_MEETING_OWNER_CAN_ADD_PARTICIPANTS"}
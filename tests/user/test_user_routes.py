@@ -0,0 +1,51 @@
+async def test_user_lookup_etag_revalidation(client, users, auth_headers):
+    me, other = users[0], users[1]
+    url = f"/user/{other.account}/lookup"
+
+    first = await client.get(url, headers=auth_headers(me))
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert first.json()["account"] == other.account
+
+    unchanged = await client.get(
+        url, headers={**auth_headers(me), "If-None-Match": etag}
+    )
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+
+    stale = await client.get(
+        url, headers={**auth_headers(me), "If-None-Match": 'W/"stale"'}
+    )
+    assert stale.status_code == 200
+    assert stale.headers["ETag"] == etag
+
+
+async def test_user_lookup_unknown_account_is_not_found(client, users, auth_headers):
+    response = await client.get("/user/nobody/lookup", headers=auth_headers(users[0]))
+
+    assert response.status_code == 404
+    assert response.json() == {"errors": "USER_NOT_FOUND"}
+
+
+async def test_user_search_counts_only_the_first_page(client, users, auth_headers):
+    headers = auth_headers(users[0])
+
+    first = await client.get(
+        "/user/find", params={"q": "Test User", "limit": 3}, headers=headers
+    )
+    body = first.json()
+    assert body["count"] == len(users)
+    assert [user["id"] for user in body["data"]] == sorted(
+        str(user.id) for user in users
+    )[:3]
+    assert body["next_cursor"] == body["data"][-1]["id"]
+
+    second = await client.get(
+        "/user/find",
+        params={"q": "Test User", "limit": 3, "cursor": body["next_cursor"]},
+        headers=headers,
+    )
+    body = second.json()
+    assert body["count"] is None
+    assert len(body["data"]) == 1
+    assert body["next_cursor"] is None
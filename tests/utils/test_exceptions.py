@@ -0,0 +1,88 @@
+import json
+import uuid
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+
+from app.main import create_app
+from app.utils.exceptions import (
+    InvalidRequestError,
+    NotFoundError,
+    get_error_code,
+    invalid_request_handler,
+)
+
+
+@pytest.mark.parametrize(
+    ("exc", "status_code", "error"),
+    [
+        (InvalidRequestError("Cannot follow yourself"), 400, "CANNOT_FOLLOW_YOURSELF"),
+        (InvalidRequestError("INVALID_CURSOR"), 400, "INVALID_CURSOR"),
+        (NotFoundError("Meeting type not found"), 404, "MEETING_TYPE_NOT_FOUND"),
+    ],
+)
+async def test_invalid_request_handler(exc, status_code, error):
+    response = await invalid_request_handler(None, exc)
+
+    assert response.status_code == status_code
+    assert json.loads(response.body) == {"errors": error}
+
+
+def test_error_code_strips_trailing_punctuation():
+    assert get_error_code(" Meeting not found. ") == "MEETING_NOT_FOUND"
+
+
+async def test_not_found_error_maps_to_404(client, users, auth_headers):
+    response = await client.get(
+        f"/meeting/types/{uuid.uuid4()}", headers=auth_headers(users[0])
+    )
+
+    assert response.status_code == 404
+    assert response.json() == {"errors": "MEETING_TYPE_NOT_FOUND"}
+
+
+async def test_invalid_request_error_maps_to_400(client, users, auth_headers):
+    response = await client.post(
+        f"/follow/{users[0].id}/start", headers=auth_headers(users[0])
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"errors": "CANNOT_FOLLOW_YOURSELF"}
+
+
+async def test_pydantic_validation_error_keeps_its_422():
+    class Strict(BaseModel):
+        count: int
+
+    app = create_app()
+
+    @app.get("/validate", tags=["test"])
+    async def validate() -> None:
+        Strict(count="many")
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/validate")
+
+    assert response.status_code == 422
+    assert response.json() == {"errors": {"count": "VALIDATION_COUNT_INVALID"}}
+
+
+async def test_stray_value_error_is_a_server_error():
+    """A ValueError from a bug is not echoed back as a client error."""
+    app = create_app()
+
+    @app.get("/broken", tags=["test"])
+    async def broken() -> None:
+        uuid.UUID("not-a-uuid")
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app, raise_app_exceptions=False),
+        base_url="http://test",
+    ) as client:
+        response = await client.get("/broken")
+
+    assert response.status_code == 500
+    assert "not-a-uuid" not in response.text
@@ -0,0 +1,36 @@
+from app.utils.redisdb import RedisClient
+
+
+async def test_incr_sends_incr_and_expire_in_one_transaction(redis):
+    assert await redis.incr("ratelimit:test", ttl=60) == 1
+
+    assert redis.redis.executed_pipelines == [["incr", "expire"]]
+    assert redis.redis.ttls["ratelimit:test"] == 60
+
+
+async def test_incr_does_not_extend_a_running_window(redis):
+    await redis.incr("ratelimit:test", ttl=60)
+    redis.redis.ttls["ratelimit:test"] = 12
+
+    assert await redis.incr("ratelimit:test", ttl=60) == 2
+    assert redis.redis.ttls["ratelimit:test"] == 12
+
+
+async def test_incr_gives_a_counter_without_ttl_one(redis):
+    redis.redis.store["ratelimit:test"] = "5"
+
+    assert await redis.incr("ratelimit:test", ttl=60) == 6
+    assert redis.redis.ttls["ratelimit:test"] == 60
+
+
+async def test_incr_without_redis_does_not_limit():
+    assert await RedisClient().incr("ratelimit:test", ttl=60) is None
+
+
+async def test_delete_many_sends_one_variadic_delete(redis):
+    redis.redis.store.update({"a": "1", "b": "2", "c": "3"})
+
+    assert await redis.delete_many("a", "b") is True
+
+    assert redis.redis.store == {"c": "3"}
+    assert redis.redis.executed_pipelines == []